@@ -1,5 +1,7 @@
 from dotenv import load_dotenv
+import asyncio
 import os
+import sys
 #获取上一级目录
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 #尝试加载项目目录下的.env文件
@@ -8,6 +10,14 @@ if os.path.exists(os.path.join(BASE_DIR, ".env")):
 else:
     print(f"[FNewsCrawler]-> {BASE_DIR}目录下的 .env 不存在，必要的环境变量有可能无法设置")
 
+#非Windows平台优先使用uvloop作为事件循环，未安装时静默回退到默认事件循环
+if sys.platform != "win32":
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
 from .utils.path import get_project_root
 from .utils.logger import LOGGER
 
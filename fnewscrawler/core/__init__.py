@@ -1,8 +1,8 @@
 from .browser import BrowserManager, browser_manager
-from .redis_manager import RedisManager, get_redis
+from .redis_manager import RedisManager, get_redis, AsyncRedisManager, get_async_redis
 from .context import context_manager
 from .qr_login_base import QRLoginBase
 from .news_crawl import news_crawl_from_url
 from .tushare_data_provider import TushareDataProvider
-__all__ = ["BrowserManager", "RedisManager", "get_redis", "context_manager", "browser_manager", "news_crawl_from_url",
+__all__ = ["BrowserManager", "RedisManager", "get_redis", "AsyncRedisManager", "get_async_redis", "context_manager", "browser_manager", "news_crawl_from_url",
            "QRLoginBase", "TushareDataProvider"]
@@ -1,12 +1,16 @@
 import asyncio
 import os
 import time
+from contextvars import ContextVar
 from typing import Optional
 
 from playwright.async_api import async_playwright, Browser, Playwright
 
 from fnewscrawler.utils.logger import LOGGER
 
+# 当前任务通过 async with 进入时对应的关闭代数，嵌套进入时依次追加
+_entered_generations: ContextVar[tuple] = ContextVar("browser_entered_generations", default=())
+
 
 class BrowserManager:
     """
@@ -32,6 +36,8 @@ class BrowserManager:
         self._health_check_interval = 30  # 30秒健康检查间隔
         self._max_retry_attempts = 3
         self._retry_delay = 2  # 重试延迟
+        self._refcount = 0  # async with 嵌套/并发使用计数，最后一个退出时才真正关闭
+        self._close_generation = 0  # 每次关闭加一，关闭前进入的使用者退出时不再影响计数
         self._init_done = True
         self._use_headless = True if os.getenv("PW_USE_HEADLESS", "true") == "true" else False
 
@@ -120,6 +126,9 @@ class BrowserManager:
 
     async def initialize(self) -> None:
         """公共初始化方法"""
+        # 双重检查：浏览器已可用时直接返回，不必每次都获取锁
+        if await self._is_browser_healthy():
+            return
         async with self._init_lock:
             if await self._is_browser_healthy():
                 return
@@ -193,17 +202,36 @@ class BrowserManager:
         async with self._browser_lock:
             LOGGER.info("正在关闭 BrowserManager...")
             self._is_initializing = False
+            # 直接关闭(如监控接口)后计数作废，之后重新初始化的浏览器由新的使用者重新计数
+            self._refcount = 0
+            self._close_generation += 1
             await self._cleanup_browser_resources()
             LOGGER.info("BrowserManager 已关闭")
 
     async def __aenter__(self):
-        """异步上下文管理器支持"""
-        await self.initialize()
+        """异步上下文管理器支持，多处同时使用时共享同一个浏览器实例"""
+        generation = self._close_generation
+        self._refcount += 1
+        token = _entered_generations.set(_entered_generations.get() + (generation,))
+        try:
+            await self.initialize()
+        except Exception:
+            _entered_generations.reset(token)
+            if generation == self._close_generation:
+                self._refcount -= 1
+            raise
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        """异步上下文管理器支持"""
-        await self.close()
+        """异步上下文管理器支持，只有最后一个使用者退出时才关闭浏览器"""
+        generations = _entered_generations.get()
+        _entered_generations.set(generations[:-1])
+        # 进入之后浏览器已被直接关闭过，计数已重置，不能再减少新使用者的计数
+        if not generations or generations[-1] != self._close_generation:
+            return
+        self._refcount -= 1
+        if self._refcount == 0:
+            await self.close()
 
 
 # 单例实例
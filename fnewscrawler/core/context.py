@@ -375,6 +375,21 @@ class ContextManager:
         await self._force_close_context(site_name, reason="refresh")
         return await self.get_context(site_name, force_new=True)
 
+    async def _build_site_context_info(self, site_name: str, current_time: float) -> Dict[str, Any]:
+        """构建单个站点上下文的统计信息"""
+        creation_time = self._context_creation_time.get(site_name, 0)
+        last_used = self._context_last_used.get(site_name, 0)
+        usage_count = self._context_usage_count.get(site_name, 0)
+
+        return {
+            "age_seconds": int(current_time - creation_time),
+            "idle_seconds": int(current_time - last_used),
+            "usage_count": usage_count,
+            "is_healthy": await self._is_context_healthy(self._contexts[site_name]),
+            "last_used": last_used,
+            "creation_time": creation_time
+        }
+
     async def get_context_stats(self) -> Dict[str, Any]:
         """获取上下文管理器统计信息"""
         current_time = time.time()
@@ -384,21 +399,16 @@ class ContextManager:
             "contexts": {}
         }
 
-        for site_name in self._contexts:
-            creation_time = self._context_creation_time.get(site_name, 0)
-            last_used = self._context_last_used.get(site_name, 0)
-            usage_count = self._context_usage_count.get(site_name, 0)
-
-            stats["contexts"][site_name] = {
-                "age_seconds": int(current_time - creation_time),
-                "idle_seconds": int(current_time - last_used),
-                "usage_count": usage_count,
-                "is_healthy": await self._is_context_healthy(self._contexts[site_name]),
-                "last_used": last_used,
-                "creation_time": creation_time
-            }
+        for site_name in list(self._contexts):
+            stats["contexts"][site_name] = await self._build_site_context_info(site_name, current_time)
         return stats
 
+    async def get_site_context_info(self, site_name: str) -> Optional[Dict[str, Any]]:
+        """获取指定站点上下文的统计信息，上下文不存在时返回None，不会遍历其他站点"""
+        if site_name not in self._contexts:
+            return None
+        return await self._build_site_context_info(site_name, time.time())
+
     async def close_site_context(self, site_name: str):
         """关闭指定站点的上下文"""
         site_lock = await self._get_site_lock(site_name)
@@ -3,7 +3,7 @@ import asyncio
 from playwright.async_api import TimeoutError
 
 from fnewscrawler.core.context import context_manager
-from fnewscrawler.core.redis_manager import get_cached_news_content, cache_news_content
+from fnewscrawler.core.redis_manager import aget_cached_news_content, acache_news_content
 from fnewscrawler.utils import extract_second_level_domain, LOGGER
 
 # 采用二级域名来映射选择器，选择器都是 CSS 或 ID 类型，不要填写其他选择器，否则没有提速加成
@@ -122,6 +122,12 @@ news_selector_map = {
 
 }
 
+# 列表形式的选择器在模块加载时组合成一个选择器，一次查询，避免每次抓取都重新拼接
+_combined_selector_map = {
+    domain: ",".join(selector) if isinstance(selector, list) else selector
+    for domain, selector in news_selector_map.items()
+}
+
 
 async def get_real_url(page, initial_url):
     # 尝试等待 URL 变化
@@ -149,6 +155,10 @@ CONTEXT_TYPE_MAP = {
 
 }
 
+# 正在抓取中的(URL, 上下文类型) -> 抓取任务，用于合并同一URL的并发请求
+# 不同上下文类型携带的登录状态不同，不能共用抓取结果
+_inflight_crawls: dict[tuple[str, str], asyncio.Task] = {}
+
 
 async def news_crawl_from_url(url: str, context_type: str = "common") -> tuple:
     """从指定URL爬取新闻内容。
@@ -167,15 +177,28 @@ async def news_crawl_from_url(url: str, context_type: str = "common") -> tuple:
            新闻URL是指实际访问的URL，可能与输入的URL不同，比如带了跳转链接的URL。
 
    """
+    # 同一URL、同一上下文类型的并发请求合并为一次抓取，其他调用方直接等待同一个任务的结果
+    key = (url, context_type)
+    task = _inflight_crawls.get(key)
+    if task is None:
+        task = asyncio.create_task(_news_crawl_from_url(url, context_type))
+        _inflight_crawls[key] = task
+        task.add_done_callback(lambda _: _inflight_crawls.pop(key, None))
+    # shield保证某个调用方被取消时不会连带取消其他调用方正在等待的抓取
+    return await asyncio.shield(task)
+
+
+async def _news_crawl_from_url(url: str, context_type: str = "common") -> tuple:
+    """实际执行新闻抓取，由 news_crawl_from_url 负责合并同一URL的并发请求"""
     page = None
     try:
-        # 尝试带上对应的上下文，增强反爬检测
-        context_type = CONTEXT_TYPE_MAP.get(extract_second_level_domain(url), context_type)
-        # 在浏览器没进行实际跳转操作时就查询有没有缓存，避免浪费浏览器资源
-        news_content = get_cached_news_content(url)
+        # 在做任何域名解析和浏览器操作前先查缓存，命中直接返回
+        news_content = await aget_cached_news_content(url)
         if news_content:
             return url, news_content
 
+        # 尝试带上对应的上下文，增强反爬检测
+        context_type = CONTEXT_TYPE_MAP.get(extract_second_level_domain(url), context_type)
         context = await context_manager.get_context(context_type)
         # 可以考虑在这里设置一个全局的默认超时，比如 10 秒
         # context.set_default_timeout(10000)
@@ -188,20 +211,20 @@ async def news_crawl_from_url(url: str, context_type: str = "common") -> tuple:
         current_url = await get_real_url(page, url)
         # print("current url:" , current_url)
         # 再次尝试获取缓存内容，主要是针对url是带有跳转的情况
-        news_content = get_cached_news_content(current_url)
+        news_content = await aget_cached_news_content(current_url)
         if news_content:
             return current_url, news_content
 
         # 获取二级域名
         second_level_domain = extract_second_level_domain(current_url)
 
-        # 获取新闻选择器
-        news_selector = news_selector_map.get(second_level_domain, None)
+        # 获取新闻选择器（已预先组合好）
+        news_selector = _combined_selector_map.get(second_level_domain, None)
         # 用一个更明确的变量名
         fail_to_get_specific_content = False
 
         # 尝试提取指定选择器下的新闻内容
-        if isinstance(news_selector, str):
+        if news_selector:
             try:
                 # 默认会等待元素出现并可见，可以根据需要设置更短的 timeout
                 news_content = await page.locator(news_selector).inner_text(timeout=3000)  # 5秒超时
@@ -209,15 +232,6 @@ async def news_crawl_from_url(url: str, context_type: str = "common") -> tuple:
                 fail_to_get_specific_content = True
             except Exception as e:  # 捕获其他可能的错误
                 fail_to_get_specific_content = True
-        elif isinstance(news_selector, list):
-            try:
-                # 组合选择器，一次查询
-                combined_selector = ",".join(news_selector)
-                news_content = await page.locator(combined_selector).inner_text(timeout=3000)  # 5秒超时
-            except TimeoutError:  # 捕获特定的超时错误
-                fail_to_get_specific_content = True
-            except Exception as e:  # 捕获其他可能的错误
-                fail_to_get_specific_content = True
         else:  # 如果没有定义选择器
             fail_to_get_specific_content = True
 
@@ -227,8 +241,8 @@ async def news_crawl_from_url(url: str, context_type: str = "common") -> tuple:
 
         # 将html内容缓存，如果url不同就缓存两份，主要是假设能尽快的获取到跳转后的内容
         if url != current_url:
-            cache_news_content(url, news_content)
-        cache_news_content(current_url, news_content)
+            await acache_news_content(url, news_content)
+        await acache_news_content(current_url, news_content)
 
         return current_url, news_content
     except Exception as e:
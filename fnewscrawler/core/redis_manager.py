@@ -1,10 +1,12 @@
 import json
 import os
 import pickle
-import base64
 from threading import Lock
 from typing import Any, Optional, Union
+import orjson
 import redis
+from cachetools import TTLCache
+import redis.asyncio as aioredis
 from fnewscrawler.utils.logger import LOGGER
 
 
@@ -89,7 +91,7 @@ class RedisManager:
             key: 键名
             value: 值
             ex: 过期时间(秒)
-            serializer: 序列化方式 ('json', 'pickle', 'str')
+            serializer: 序列化方式 ('json', 'json-stdlib', 'pickle', 'str')
         """
         try:
             serialized_value = self._serialize(value, serializer)
@@ -104,7 +106,7 @@ class RedisManager:
 
         Args:
             key: 键名
-            serializer: 反序列化方式 ('json', 'pickle', 'str')
+            serializer: 反序列化方式 ('json', 'json-stdlib', 'pickle', 'str')
         """
         try:
             value = self.redis_client.get(key)
@@ -115,6 +117,26 @@ class RedisManager:
             self.logger.error(f"Redis get操作失败 {key}: {e}")
             return None
 
+    def mget(self, keys: list, serializer: str = 'json') -> list:
+        """
+        批量获取键值，一次网络往返
+
+        Args:
+            keys: 键名列表
+            serializer: 反序列化方式 ('json', 'json-stdlib', 'pickle', 'str')
+
+        Returns:
+            与keys顺序一致的值列表，不存在的键对应None
+        """
+        if not keys:
+            return []
+        try:
+            values = self.redis_client.mget(keys)
+            return [None if v is None else self._deserialize(v, serializer) for v in values]
+        except Exception as e:
+            self.logger.error(f"Redis mget操作失败: {e}")
+            return [None] * len(keys)
+
     def delete(self, *keys: str) -> int:
         """删除键"""
         try:
@@ -250,12 +272,15 @@ class RedisManager:
         """
         try:
             if serializer == 'json':
-                # JSON序列化为字符串，然后编码为bytes
+                # orjson直接输出utf-8编码的bytes，省去str->bytes的中间编码
+                return orjson.dumps(value, default=str, option=orjson.OPT_NON_STR_KEYS)
+            elif serializer == 'json-stdlib':
+                # 标准库JSON序列化为字符串，然后编码为bytes
                 json_str = json.dumps(value, ensure_ascii=False, default=str)
                 return json_str.encode('utf-8')
             elif serializer == 'pickle':
-                # pickle直接序列化为bytes
-                return pickle.dumps(value)
+                # pickle直接序列化为bytes，使用最高协议版本，对DataFrame等大块数据更快更紧凑
+                return pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
             elif serializer == 'str':
                 # 字符串编码为bytes
                 return str(value).encode('utf-8')
@@ -278,19 +303,13 @@ class RedisManager:
         """
         try:
             if serializer == 'json':
-                # 确保value是字符串格式
-                if isinstance(value, bytes):
-                    value = value.decode('utf-8')
+                # orjson可以直接解析bytes
+                return orjson.loads(value)
+            elif serializer == 'json-stdlib':
+                # json.loads可以直接解析utf-8编码的bytes，无需先decode
                 return json.loads(value)
             elif serializer == 'pickle':
-                # pickle需要bytes格式
-                if isinstance(value, str):
-                    # 如果是字符串，可能是base64编码的，尝试解码
-                    try:
-                        value = base64.b64decode(value)
-                    except:
-                        # 如果不是base64，直接编码为bytes
-                        value = value.encode('utf-8')
+                # 连接池不解码响应，value本身就是pickle写入的原始bytes
                 return pickle.loads(value)
             elif serializer == 'str':
                 # 返回字符串
@@ -335,19 +354,20 @@ class RedisManager:
             self.logger.error(f"Redis decr操作失败 {key}: {e}")
             return 0
 
-    def scan_iter(self, match: str = '*') -> list:
+    def scan_iter(self, match: str = '*', count: Optional[int] = None) -> list:
         """
         迭代扫描匹配的键
 
         Args:
             match: 匹配的键模式，默认为'*'，表示匹配所有键
+            count: 每次SCAN的COUNT提示值，越大游标往返次数越少，默认使用Redis默认值(10)
 
         Returns:
             匹配的键列表
         """
         data_list = []
         try:
-            for key in self.redis_client.scan_iter(match=match):
+            for key in self.redis_client.scan_iter(match=match, count=count):
                 if isinstance(key, bytes):
                     key = key.decode('utf-8')
                 data_list.append(key)
@@ -366,8 +386,112 @@ class RedisManager:
             self.logger.error(f"关闭Redis连接失败: {e}")
 
 
+class AsyncRedisManager:
+    """
+    异步Redis管理类 - 单例模式
+    基于redis.asyncio，供协程中使用，避免同步网络IO阻塞事件循环
+    序列化方式与RedisManager保持一致，两者读写的数据可以互通
+    """
+
+    _instance = None
+    _lock = Lock()
+
+    def __new__(cls, *args, **kwargs):
+        """单例模式实现"""
+        if not cls._instance:
+            with cls._lock:
+                if not cls._instance:
+                    cls._instance = super(AsyncRedisManager, cls).__new__(cls)
+        return cls._instance
+
+    def __init__(self, max_connections=50):
+        """初始化异步Redis连接池，连接在首次使用时才会建立"""
+        if hasattr(self, '_initialized'):
+            return
+
+        self.logger = LOGGER
+
+        self.pool = aioredis.ConnectionPool(
+            host=os.getenv('REDIS_HOST', 'localhost'),
+            port=int(os.getenv('REDIS_PORT', '6379')),
+            db=int(os.getenv('REDIS_DB', '0')),
+            password=os.getenv('REDIS_PASSWORD', None),
+            decode_responses=False,
+            max_connections=max_connections,
+            retry_on_timeout=True
+        )
+        self.redis_client = aioredis.Redis(connection_pool=self.pool)
+        self._initialized = True
+
+    # 复用同步管理器的序列化实现
+    _serialize = RedisManager._serialize
+    _deserialize = RedisManager._deserialize
+
+    def get_client(self) -> aioredis.Redis:
+        """获取异步Redis客户端实例"""
+        return self.redis_client
+
+    async def set(self, key: str, value: Any, ex: Optional[int] = None,
+                  serializer: str = 'json') -> bool:
+        """设置键值对"""
+        try:
+            serialized_value = self._serialize(value, serializer)
+            return await self.redis_client.set(key, serialized_value, ex=ex)
+        except Exception as e:
+            self.logger.error(f"Redis async set操作失败 {key}: {e}")
+            return False
+
+    async def get(self, key: str, serializer: str = 'json') -> Any:
+        """获取键值"""
+        try:
+            value = await self.redis_client.get(key)
+            if value is None:
+                return None
+            return self._deserialize(value, serializer)
+        except Exception as e:
+            self.logger.error(f"Redis async get操作失败 {key}: {e}")
+            return None
+
+    async def mget(self, keys: list, serializer: str = 'json') -> list:
+        """批量获取键值，返回与keys顺序一致的列表，不存在的键对应None"""
+        if not keys:
+            return []
+        try:
+            values = await self.redis_client.mget(keys)
+            return [None if v is None else self._deserialize(v, serializer) for v in values]
+        except Exception as e:
+            self.logger.error(f"Redis async mget操作失败: {e}")
+            return [None] * len(keys)
+
+    async def hset(self, name: str, mapping: dict, serializer: str = 'json') -> int:
+        """设置哈希字段"""
+        try:
+            serialized_mapping = {k: self._serialize(v, serializer) for k, v in mapping.items()}
+            return await self.redis_client.hset(name, mapping=serialized_mapping)
+        except Exception as e:
+            self.logger.error(f"Redis async hset操作失败 {name}: {e}")
+            return 0
+
+    async def hdel(self, name: str, *keys: str) -> int:
+        """删除哈希字段"""
+        try:
+            return await self.redis_client.hdel(name, *keys)
+        except Exception as e:
+            self.logger.error(f"Redis async hdel操作失败 {name}: {e}")
+            return 0
+
+    async def close(self):
+        """关闭异步Redis连接"""
+        try:
+            await self.pool.disconnect()
+            self.logger.info("异步Redis连接已关闭")
+        except Exception as e:
+            self.logger.error(f"关闭异步Redis连接失败: {e}")
+
+
 # 全局Redis管理器实例
 redis_manager = RedisManager()
+async_redis_manager = AsyncRedisManager()
 
 
 # ==================== 便捷函数 ====================
@@ -377,15 +501,83 @@ def get_redis() -> RedisManager:
     return redis_manager
 
 
+def get_async_redis() -> AsyncRedisManager:
+    """获取异步Redis管理器实例"""
+    return async_redis_manager
+
+
+def _news_content_expired_time() -> int:
+    """新闻内容缓存过期时间，从环境变量获取,单位天,默认3天"""
+    return int(os.environ.get("NEWS_CONTENT_EXPIRED_TIME", 3)) * 86400
+
+
+# 进程内新闻内容缓存，位于Redis之前，热点URL（重试、重复查询）无需网络往返
+# TTLCache不是线程安全的，读写需要加锁
+_local_news_cache = TTLCache(maxsize=int(os.environ.get("NEWS_CONTENT_LOCAL_CACHE_SIZE", 2048)),
+                             ttl=int(os.environ.get("NEWS_CONTENT_LOCAL_CACHE_TTL", 300)))
+_local_news_cache_lock = Lock()
+
+
+def _local_news_get(url: str) -> Optional[str]:
+    with _local_news_cache_lock:
+        return _local_news_cache.get(url)
+
+
+def _local_news_set(contents: dict) -> None:
+    with _local_news_cache_lock:
+        for url, content in contents.items():
+            if content:
+                _local_news_cache[url] = content
+
+
 def cache_news_content(url: str, content: str) -> bool:
     """缓存新闻内容"""
+    _local_news_set({url: content})
     key = f"news:content:{url}"
-    # 从环境变量获取过期时间,单位天,默认3天
-    expired_time = int(os.environ.get("NEWS_CONTENT_EXPIRED_TIME", 3)) * 86400
-    return redis_manager.set(key, content, ex=expired_time, serializer='str')
+    return redis_manager.set(key, content, ex=_news_content_expired_time(), serializer='str')
 
 
 def get_cached_news_content(url: str) -> Optional[str]:
-    """获取缓存的新闻内容"""
+    """获取缓存的新闻内容，优先读取进程内缓存"""
+    content = _local_news_get(url)
+    if content:
+        return content
+    key = f"news:content:{url}"
+    content = redis_manager.get(key, serializer='str')
+    _local_news_set({url: content})
+    return content
+
+
+async def acache_news_content(url: str, content: str) -> bool:
+    """缓存新闻内容（异步）"""
+    _local_news_set({url: content})
+    key = f"news:content:{url}"
+    return await async_redis_manager.set(key, content, ex=_news_content_expired_time(), serializer='str')
+
+
+async def aget_cached_news_content(url: str) -> Optional[str]:
+    """获取缓存的新闻内容（异步），优先读取进程内缓存"""
+    content = _local_news_get(url)
+    if content:
+        return content
     key = f"news:content:{url}"
-    return redis_manager.get(key, serializer='str')
+    content = await async_redis_manager.get(key, serializer='str')
+    _local_news_set({url: content})
+    return content
+
+
+async def abatch_get_cached_news_content(urls: list) -> dict:
+    """批量获取缓存的新闻内容（异步），返回 {url: content}，未命中的url不在结果中"""
+    result = {}
+    miss_urls = []
+    for url in urls:
+        content = _local_news_get(url)
+        if content:
+            result[url] = content
+        else:
+            miss_urls.append(url)
+    values = await async_redis_manager.mget([f"news:content:{url}" for url in miss_urls], serializer='str')
+    fetched = {url: content for url, content in zip(miss_urls, values) if content}
+    _local_news_set(fetched)
+    result.update(fetched)
+    return result
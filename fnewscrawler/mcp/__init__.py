@@ -1,17 +1,18 @@
+import importlib
+import pkgutil
+
 from fastmcp import FastMCP
 mcp_server = FastMCP("FNewsCrawler")
-from .mcp_manager import MCPManager
+from .mcp_manager import MCPManager, mcp_manager
 
-#将子包下的mcp工具更新进来
-import fnewscrawler.mcp.iwencai
-import fnewscrawler.mcp.common
-import fnewscrawler.mcp.eastmoney
-import fnewscrawler.mcp.indicator
-import fnewscrawler.mcp.tushare
-import fnewscrawler.mcp.akshare
+#将子包下的mcp工具更新进来，自动发现所有子包，新增工具包无需在此手动登记
+for _module_info in pkgutil.iter_modules(__path__):
+    if _module_info.ispkg:
+        importlib.import_module(f"{__name__}.{_module_info.name}")
 
 
 __all__ = [
     "mcp_server",
-    "MCPManager"
+    "MCPManager",
+    "mcp_manager"
 ]
\ No newline at end of file
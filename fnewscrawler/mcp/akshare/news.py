@@ -11,7 +11,7 @@ def get_ak_news_cctv(date: str)->str:
         date: 日期，格式'YYYYMMDD'，如'20250829'
 
     Returns:
-        包含新闻数据的markdown表格，列名包括：日期、内容
+        包含新闻数据的markdown表格（超过200行时为制表符分隔的文本），列名包括：日期、内容
     """
     markdown_table = ak_news_cctv(date)
     return markdown_table
@@ -28,7 +28,7 @@ def get_ak_stock_news_em(stock_code: str, start_date: str = "20250829")->str:
         start_date: 开始日期，格式'YYYYMMDD'，如'20250829'
 
     Returns:
-        包含新闻数据的markdown表格，列名包括：新闻标题、新闻内容、发布时间、文章来源
+        包含新闻数据的markdown表格（超过200行时为制表符分隔的文本），列名包括：新闻标题、新闻内容、发布时间、文章来源
     """
     markdown_table = ak_stock_news_em(stock_code, start_date)
     return markdown_table
@@ -45,7 +45,7 @@ def get_ak_stock_news_main_cx(start_date: str = "20250829")->str:
         start_date: 开始日期，格式'YYYYMMDD'，如'20250829'
 
     Returns:
-        包含新闻数据的markdown表格，列名包括：新闻标签、新闻内容、发布时间
+        包含新闻数据的markdown表格（超过200行时为制表符分隔的文本），列名包括：新闻标签、新闻内容、发布时间
     """
     markdown_table = ak_stock_news_main_cx(start_date)
     return markdown_table
@@ -2,8 +2,9 @@ import os
 
 from fnewscrawler.mcp import mcp_server
 from fnewscrawler.core.news_crawl import news_crawl_from_url
+from fnewscrawler.core.redis_manager import abatch_get_cached_news_content
 import asyncio
-from fnewscrawler.utils import parse_params2list
+from fnewscrawler.utils import parse_params2list, run_bounded
 
 @mcp_server.tool(title="通用新闻内容提取工具")
 async def news_crawl(url: str) -> str:
@@ -77,17 +78,16 @@ async def news_crawl_batch(urls: list[str]) -> list[dict]:
         4. 对于无法解析的页面，content可能为空字符串
     """
     urls = parse_params2list(urls, str)
-    # 创建信号量限制最大并发数为20
-    semaphore = asyncio.Semaphore(int(os.getenv("MAX_CRAWL_CONCURRENCY", 20)))
-
-    async def fetch_with_semaphore(url):
-        async with semaphore:
-            return await news_crawl_from_url(url)
-
-    # 使用信号量控制并发抓取所有URL内容
-    tasks = [fetch_with_semaphore(url) for url in urls]
-    results = await asyncio.gather(*tasks)
-
-    # 将结果和URL组合成字典列表
-    return [{"url": url, "content": content}
-            for (url, (_, content)) in zip(urls, results)]
\ No newline at end of file
+    # 重复的URL只抓取一次，dict.fromkeys去重同时保持原有顺序
+    unique_urls = list(dict.fromkeys(urls))
+    # 先用一次MGET批量查询缓存，只对未命中的URL启动浏览器抓取
+    contents = await abatch_get_cached_news_content(unique_urls)
+    miss_urls = [url for url in unique_urls if url not in contents]
+
+    # 有限并发抓取未命中缓存的URL，最大并发数默认为20，单个URL失败时内容为空字符串
+    results = await run_bounded(miss_urls, news_crawl_from_url, int(os.getenv("MAX_CRAWL_CONCURRENCY", 20)))
+    for url, result in zip(miss_urls, results):
+        contents[url] = "" if isinstance(result, Exception) else result[1]
+
+    # 按调用方传入的原始顺序（含重复URL）组装结果
+    return [{"url": url, "content": contents.get(url, "")} for url in urls]
\ No newline at end of file
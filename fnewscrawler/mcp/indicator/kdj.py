@@ -1,8 +1,51 @@
+import pandas as pd
+
 from fnewscrawler.core import TushareDataProvider
 from fnewscrawler.mcp import mcp_server
 from fnewscrawler.utils import format_param
 
 
+def calc_kdj(data: pd.DataFrame, fastk_period: int = 9, slowk_period: int = 3, slowd_period: int = 3) -> pd.DataFrame:
+    """
+    根据按交易日升序排列的日线数据计算KDJ，返回trade_date、K、D、J四列
+
+    Args:
+        data (pd.DataFrame): 包含trade_date、high、low、close列的日线数据
+        fastk_period (int, optional): RSV周期. 默认值: 9
+        slowk_period (int, optional): K值平滑周期. 默认值: 3
+        slowd_period (int, optional): D值平滑周期. 默认值: 3
+
+    Returns:
+        pd.DataFrame: KDJ指标数据
+    """
+    data = data.copy()
+
+    # ------------------------ 计算 RSV（未成熟随机值）------------------------
+    # 公式：RSV = (CLOSE - LLV(LOW,9)) / (HHV(HIGH,9) - LLV(LOW,9)) * 100
+    data['LLV'] = data['low'].rolling(window=fastk_period).min()
+    data['HHV'] = data['high'].rolling(window=fastk_period).max()
+
+    # 防止除零（如一字板导致 HHV == LLV）
+    rsv_raw = (data['close'] - data['LLV']) / (data['HHV'] - data['LLV']) * 100
+    data['RSV'] = rsv_raw.fillna(0).clip(0, 100)  # 填充 NaN 为 0，并限制在 [0,100]
+
+    # ------------------------ 计算 K、D、J ------------------------
+    # SMA(X, m, 1): Y = (m-1)/m * Y_前 + 1/m * X，即 alpha=1/m 且不做调整的指数加权平均
+    # 初始值：K=50, D=50，因此把第一天的RSV替换为50作为递推起点
+    rsv_seed = data['RSV'].copy()
+    rsv_seed.iloc[0] = 50.0
+    data['K'] = rsv_seed.ewm(alpha=1 / slowk_period, adjust=False).mean()
+    data['D'] = data['K'].ewm(alpha=1 / slowd_period, adjust=False).mean()
+    data['J'] = 3 * data['K'] - 2 * data['D']
+
+    # ------------------------ 输出结果 ------------------------
+    # 只保留从第 n 天开始的有效数据（前 n-1 天 RSV 不完整）
+    result_df = data[['trade_date', 'K', 'D', 'J']].iloc[fastk_period - 1:].reset_index(drop=True)
+
+    # 丢弃nan
+    return result_df.dropna()
+
+
 @mcp_server.tool(
     title="获取指定股票的KDJ技术指标"
 )
@@ -44,49 +87,7 @@ def stock_kdj(
     # 按交易日升序排序
     data = data.sort_values(by='trade_date').reset_index(drop=True)
 
-    # ------------------------ 计算 RSV（未成熟随机值）------------------------
-    # 公式：RSV = (CLOSE - LLV(LOW,9)) / (HHV(HIGH,9) - LLV(LOW,9)) * 100
-    data['LLV'] = data['low'].rolling(window=fastk_period).min()
-    data['HHV'] = data['high'].rolling(window=fastk_period).max()
-
-    # 防止除零（如一字板导致 HHV == LLV）
-    rsv_raw = (data['close'] - data['LLV']) / (data['HHV'] - data['LLV']) * 100
-    data['RSV'] = rsv_raw.fillna(0).clip(0, 100)  # 填充 NaN 为 0，并限制在 [0,100]
-
-    # ------------------------ 手动计算 K、D、J ------------------------
-    k_values = []
-    d_values = []
-
-    for i in range(len(data)):
-        rsv = data['RSV'].iloc[i]
-        if i == 0:
-            # 初始值：K=50, D=50
-            k = 50.0
-            d = 50.0
-        else:
-            prev_k = k_values[-1]
-            prev_d = d_values[-1] if d_values else 50.0
-
-            # 使用 m1 实现 SMA(RSV, m1, 1): K = (m1-1)/m1 * K_前 + 1/m1 * RSV
-            k = ((slowk_period - 1) * prev_k + rsv) / slowk_period
-
-            # 使用 m2 实现 SMA(K, m2, 1): D = (m2-1)/m2 * D_前 + 1/m2 * K
-            d = ((slowd_period - 1) * prev_d + k) / slowd_period
-
-        k_values.append(k)
-        d_values.append(d)
-
-    # 添加到 DataFrame
-    data['K'] = k_values
-    data['D'] = d_values
-    data['J'] = 3 * data['K'] - 2 * data['D']
-
-    # ------------------------ 输出结果 ------------------------
-    # 只保留从第 n 天开始的有效数据（前 n-1 天 RSV 不完整）
-    result_df = data[['trade_date', 'K', 'D', 'J']].iloc[fastk_period - 1:].reset_index(drop=True)
-
-    # 丢弃nan
-    result_df = result_df.dropna()
+    result_df = calc_kdj(data, fastk_period, slowk_period, slowd_period)
     # 转换为Markdown格式
     markdown_table = result_df.to_markdown(index=False)
 
@@ -6,71 +6,33 @@ from fnewscrawler.mcp import mcp_server
 from fnewscrawler.utils import format_param
 
 
-@mcp_server.tool(
-    title="获取指定股票的MACD技术指标"
-)
-def stock_macd(
-        stock_code: str,
-        start_date: str,
-        end_date: str,
-        fastperiod: int = 12,
-        slowperiod: int = 26,
-        signalperiod: int = 9
-):
+def calc_macd(data: pd.DataFrame, fastperiod: int = 12, slowperiod: int = 26, signalperiod: int = 9) -> pd.DataFrame:
     """
-    计算指定股票的MACD技术指标（与同花顺/通达信完全一致），基于前复权数据计算
+    根据按交易日升序排列的日线数据计算MACD，返回trade_date、DIF、DEA、MACD四列
 
     Args:
-        stock_code (str): 股票代码，如'000001'
-        start_date (str): 起始日期，格式'YYYYMMDD'
-        end_date (str): 结束日期，格式'YYYYMMDD'
+        data (pd.DataFrame): 包含trade_date、close列的日线数据
         fastperiod (int, optional): 快线周期. 默认值: 12
         slowperiod (int, optional): 慢线周期. 默认值: 26
         signalperiod (int, optional): 信号线周期. 默认值: 9
 
     Returns:
-        str: 包含MACD指标数据的Markdown格式表格
+        pd.DataFrame: MACD指标数据
     """
-    ts_data_provider = TushareDataProvider()
-    ts_code = ts_data_provider.code2tscode(stock_code)
-    data = ts_data_provider.get_stock_daily(ts_code, start_date, end_date, adjfactor=True)
-
-    if data.empty:
-        return "获取股票数据失败"
-
-    fastperiod = format_param(fastperiod, int)
-    slowperiod = format_param(slowperiod, int)
-    signalperiod = format_param(signalperiod, int)
-
-    required_length = max(fastperiod, slowperiod, signalperiod)
-    if len(data) < required_length:
-        return "数据不足，无法计算MACD指标"
-
-    # 按交易日升序排序（必须！）
-    data = data.sort_values(by='trade_date').reset_index(drop=True)
-
     # 确保收盘价为数值
     close = pd.to_numeric(data['close'], errors='coerce')
 
-    # print(f"前5个收盘价: {close.head().values}")
-
     # ------------------------ 修正版 EMA：与同花顺完全一致 ------------------------
     def calc_ema(series, period):
         """
         计算 EMA，初始值为第一个值，后续按 α=2/(N+1) 递推
         符合同花顺、通达信标准
         """
-        ema = np.zeros(len(series)) * np.nan
         alpha = 2.0 / (period + 1)
-
-        for i in range(len(series)):
-            if i == 0:
-                ema[i] = series.iloc[i]  # 第一天 EMA = 当日收盘价
-            else:
-                # EMA_today = α * price_today + (1 - α) * EMA_yesterday
-                ema[i] = alpha * series.iloc[i] + (1 - alpha) * ema[i - 1]
-            # 注意：前面不设 NaN，所有值都参与递推（从第1天开始就有值）
-        return ema
+        # 第一天 EMA = 当日收盘价，之后 EMA_today = α * price_today + (1 - α) * EMA_yesterday
+        # 即不做调整(adjust=False)的指数加权平均，由pandas在C层完成递推
+        # 注意：前面不设 NaN，所有值都参与递推（从第1天开始就有值）
+        return series.ewm(alpha=alpha, adjust=False).mean().to_numpy()
 
     # ------------------------ 计算 DIF（快线 - 慢线）------------------------
     ema_fast = calc_ema(close, fastperiod)
@@ -95,7 +57,53 @@ def stock_macd(
     })
 
     # 去除前面可能因 slowperiod 导致的无效值（可选）
-    result_df = result_df.iloc[slowperiod - 1:].reset_index(drop=True)
+    return result_df.iloc[slowperiod - 1:].reset_index(drop=True)
+
+
+@mcp_server.tool(
+    title="获取指定股票的MACD技术指标"
+)
+def stock_macd(
+        stock_code: str,
+        start_date: str,
+        end_date: str,
+        fastperiod: int = 12,
+        slowperiod: int = 26,
+        signalperiod: int = 9
+):
+    """
+    计算指定股票的MACD技术指标（与同花顺/通达信完全一致），基于前复权数据计算
+
+    Args:
+        stock_code (str): 股票代码，如'000001'
+        start_date (str): 起始日期，格式'YYYYMMDD'
+        end_date (str): 结束日期，格式'YYYYMMDD'
+        fastperiod (int, optional): 快线周期. 默认值: 12
+        slowperiod (int, optional): 慢线周期. 默认值: 26
+        signalperiod (int, optional): 信号线周期. 默认值: 9
+
+    Returns:
+        str: 包含MACD指标数据的Markdown格式表格
+    """
+    ts_data_provider = TushareDataProvider()
+    ts_code = ts_data_provider.code2tscode(stock_code)
+    data = ts_data_provider.get_stock_daily(ts_code, start_date, end_date, adjfactor=True)
+
+    if data.empty:
+        return "获取股票数据失败"
+
+    fastperiod = format_param(fastperiod, int)
+    slowperiod = format_param(slowperiod, int)
+    signalperiod = format_param(signalperiod, int)
+
+    required_length = max(fastperiod, slowperiod, signalperiod)
+    if len(data) < required_length:
+        return "数据不足，无法计算MACD指标"
+
+    # 按交易日升序排序（必须！）
+    data = data.sort_values(by='trade_date').reset_index(drop=True)
+
+    result_df = calc_macd(data, fastperiod, slowperiod, signalperiod)
     # 转为 Markdown 表格
     markdown_table = result_df.to_markdown(index=False)
 
@@ -1,7 +1,8 @@
+import asyncio
 import time
 
 from fnewscrawler.mcp import mcp_server
-from fnewscrawler.core.redis_manager import  get_redis
+from fnewscrawler.core.redis_manager import get_redis, get_async_redis
 from fnewscrawler.utils import LOGGER
 import os
 import threading
@@ -24,26 +25,67 @@ class MCPManager:
                 if not hasattr(self, '_initialized'):
                     self.mcp_server = mcp_server
                     self.redis = get_redis()
+                    # 协程中的状态读写使用异步客户端，避免阻塞事件循环
+                    self.async_redis = get_async_redis()
                     #该环境变量用于区分多实例部署时，每个实例的mcp状态的记忆，方便恢复
                     self.deploy_node_name = os.getenv("DEPLOY_NODE_NAME", "FNewsCrawlerNode")
+                    # 所有工具的状态保存在同一个哈希中，字段为工具名称，值为是否启用
+                    self._status_key = f"fnewscrawler:{self.deploy_node_name}:mcp:status"
+                    # 工具信息的进程内短时缓存，应对前端页面的突发轮询
+                    self._cache_ttl = float(os.getenv("MCP_TOOLS_CACHE_TTL", 3))
+                    self._tools_cache = None  # (缓存时间, 工具列表)
+                    self._tool_info_cache = {}  # 工具名 -> (缓存时间, 工具信息)
+                    # 缓存未命中时只允许一个协程重建，其他协程等待后直接读缓存
+                    self._cache_lock = asyncio.Lock()
                     self._initialized = True
+
+    def _invalidate_tools_cache(self, tool_name: str = None):
+        """
+        工具状态变化后清除缓存
+        :param tool_name: 工具名称，为None时清除所有工具信息缓存
+        """
+        self._tools_cache = None
+        if tool_name is None:
+            self._tool_info_cache.clear()
+        else:
+            self._tool_info_cache.pop(tool_name, None)
+
+    async def _get_tool_obj(self, tool_name:str):
+        """
+        获取原始工具对象，只需要个别字段的调用方直接使用，避免构造信息字典
+        :param tool_name: 工具名称
+        :return: 工具对象
+        """
+        return await self.mcp_server.get_tool(tool_name)
+
     async def get_all_tools_info(self)->list:
         """
         获取所有工具
         :return: 工具列表，每个工具包含名称、描述、状态、标题
         """
-        tools_list = []
-        tools = await self.mcp_server.get_tools()
-        for tool_key, tool_obj in tools.items():
-            tools_list.append(
-                {
-                   "name": tool_obj.name,
-                   "description" : tool_obj.description,
-                    "enabled": tool_obj.enabled,
-                    "title": tool_obj.title
-                }
-            )
-        return tools_list
+        cached = self._tools_cache
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        async with self._cache_lock:
+            # 等锁期间可能已有其他协程重建好缓存
+            cached = self._tools_cache
+            if cached and time.monotonic() - cached[0] < self._cache_ttl:
+                return cached[1]
+
+            tools_list = []
+            tools = await self.mcp_server.get_tools()
+            for tool_key, tool_obj in tools.items():
+                tools_list.append(
+                    {
+                       "name": tool_obj.name,
+                       "description" : tool_obj.description,
+                        "enabled": tool_obj.enabled,
+                        "title": tool_obj.title
+                    }
+                )
+            self._tools_cache = (time.monotonic(), tools_list)
+            return tools_list
     
     async def get_tool_info(self, tool_name:str):
         """
@@ -51,14 +93,24 @@ class MCPManager:
         :param tool_name: 工具名称
         :return: 工具信息
         """
-        tool = await self.mcp_server.get_tool(tool_name)
-        info_dict = {
-            "name": tool.name,
-            "description": tool.description,
-            "enabled": tool.enabled,
-            "title": tool.title
-        }
-        return info_dict
+        cached = self._tool_info_cache.get(tool_name)
+        if cached and time.monotonic() - cached[0] < self._cache_ttl:
+            return cached[1]
+
+        async with self._cache_lock:
+            cached = self._tool_info_cache.get(tool_name)
+            if cached and time.monotonic() - cached[0] < self._cache_ttl:
+                return cached[1]
+
+            tool = await self._get_tool_obj(tool_name)
+            info_dict = {
+                "name": tool.name,
+                "description": tool.description,
+                "enabled": tool.enabled,
+                "title": tool.title
+            }
+            self._tool_info_cache[tool_name] = (time.monotonic(), info_dict)
+            return info_dict
     
 
     async def get_tool_status(self, tool_name:str)->bool:
@@ -67,8 +119,9 @@ class MCPManager:
         :param tool_name: 工具名称
         :return: True为启用，False为禁用    
         """
-        tool = await self.get_tool_info(tool_name)
-        return tool.get("enabled")
+        # 只需要enabled一个字段，直接读取工具对象，不必构造完整的信息字典
+        tool = await self._get_tool_obj(tool_name)
+        return tool.enabled
     
     async def enable_tool(self, tool_name:str)->bool:
         """
@@ -79,11 +132,12 @@ class MCPManager:
         try:
             tool = await self.mcp_server.get_tool(tool_name)
             tool.enable()
+            self._invalidate_tools_cache(tool_name)
             #主要针对有些mcp工具定义时就是关闭的，状态改变则需要记录
-            self.redis.set(f"fnewscrawler:{self.deploy_node_name}:mcp:status:{tool_name}", True)
+            await self.async_redis.hset(self._status_key, {tool_name: True})
             return True
         except Exception as e:
-            self.redis.delete(f"fnewscrawler:{self.deploy_node_name}:mcp:status:{tool_name}")
+            await self.async_redis.hdel(self._status_key, tool_name)
             return False
     
 
@@ -97,10 +151,11 @@ class MCPManager:
         try:
             tool = await self.mcp_server.get_tool(tool_name)
             tool.disable()
-            self.redis.set(f"fnewscrawler:{self.deploy_node_name}:mcp:status:{tool_name}", False)
+            self._invalidate_tools_cache(tool_name)
+            await self.async_redis.hset(self._status_key, {tool_name: False})
             return True
         except Exception as e:
-            self.redis.delete(f"fnewscrawler:{self.deploy_node_name}:mcp:status:{tool_name}")
+            await self.async_redis.hdel(self._status_key, tool_name)
             return False
 
     async def init_tools_status(self):
@@ -108,17 +163,14 @@ class MCPManager:
         数据库里面保存着用户修改的mcp工具的信息，需要在启动时恢复这些工具的状态
         :return:
         """
-        keys = self.redis.scan_iter(f"fnewscrawler:{self.deploy_node_name}:mcp:status:*")
         disable_count = 0
         enable_count = 0
         start_time = time.time()
-        for key in keys:
-            is_enabled = self.redis.get(key)
-            # key可能是字符串或字节，需要处理
-            if isinstance(key, bytes):
-                tool_name = key.decode().split(":")[-1]
-            else:
-                tool_name = key.split(":")[-1]
+        # 一次HGETALL取回所有工具状态
+        status_map = self.redis.hgetall(self._status_key)
+        if not status_map:
+            status_map = self._migrate_legacy_status()
+        for tool_name, is_enabled in status_map.items():
             if not is_enabled:
                 await self.disable_tool(tool_name)
                 disable_count += 1
@@ -128,6 +180,21 @@ class MCPManager:
 
         LOGGER.info(f"init_tools_status: 初始化mcp工具状态完成，耗时{time.time()-start_time}秒，禁用{disable_count}个工具")
 
+    def _migrate_legacy_status(self) -> dict:
+        """
+        旧版本每个工具的状态单独保存为一个key，迁移到哈希中并删除旧key，只在哈希为空时执行
+        :return: 迁移的工具状态，工具名称 -> 是否启用
+        """
+        keys = self.redis.scan_iter(f"{self._status_key}:*", count=2000)
+        if not keys:
+            return {}
+        values = self.redis.mget(keys)
+        status_map = {key.split(":")[-1]: bool(value) for key, value in zip(keys, values)}
+        self.redis.hset(self._status_key, status_map)
+        self.redis.delete(*keys)
+        LOGGER.info(f"init_tools_status: 已将{len(status_map)}个旧格式的mcp工具状态迁移到哈希中")
+        return status_map
+
     async def call_tool(self, tool_name:str, **kwargs)->dict:
         """
         调用工具
@@ -142,3 +209,7 @@ class MCPManager:
             # return result.content
         else:
             return {"error": f"工具{tool_name}不存在"}
+
+
+# 在模块级别创建 MCPManager 实例，调用方直接导入使用，无需重复构造
+mcp_manager = MCPManager()
@@ -8,12 +8,9 @@ def dataframe2str(df: pd.DataFrame) -> str:
     """将 DataFrame 转换为字符串
     格式化新闻文本
     """
-    str_content = ""
-    for index, row in df.iterrows():
-        str_content += f"时间：{row['datetime']}\n"
-        str_content += f"内容：{row['content']}\n"
-        str_content += "\n\n"
-    return str_content
+    # 整列拼接后一次性合并，避免逐行构造Series和反复拼接字符串
+    rows = "时间：" + df['datetime'].astype(str) + "\n内容：" + df['content'].astype(str) + "\n\n\n"
+    return rows.str.cat()
 
 
 @mcp_server.tool(title="从指定数据源获取股票新闻数据", enabled=False)
@@ -1,6 +1,11 @@
+from datetime import datetime
+
 import akshare as ak
 import pandas as pd
 
+from fnewscrawler.core import get_redis
+from fnewscrawler.utils import dataframe_to_text
+
 
 def ak_news_cctv(date: str)->str:
     """获取央视新闻联播文字稿数据
@@ -11,12 +16,25 @@ def ak_news_cctv(date: str)->str:
     Returns:
         包含新闻数据的DataFrame，列名包括：日期、内容
     """
+    redis = get_redis()
+    redis_key = f"akshare_news_cctv_{date}"
+    # 过去日期的新闻联播内容不会再变化，可以缓存；当天的内容可能还没更新完，不缓存
+    cacheable = date < datetime.now().strftime("%Y%m%d")
+    if cacheable:
+        # 直接get一次，未命中(包括恰好过期)时返回None，继续走下面的抓取流程
+        cached_df = redis.get(redis_key, serializer="pickle")
+        if cached_df is not None:
+            return dataframe_to_text(cached_df)
+
     news_cctv_df = ak.news_cctv(date=date)
     #丢弃title
     news_cctv_df = news_cctv_df.drop(columns=["title"])
     #重命名列
     news_cctv_df = news_cctv_df.rename(columns={"date": "日期", "content": "内容"})
-    markdown_table = news_cctv_df.to_markdown(index=False)
+    # 缓存数据，7天后过期
+    if cacheable and not news_cctv_df.empty:
+        redis.set(redis_key, news_cctv_df, ex=604800, serializer="pickle")
+    markdown_table = dataframe_to_text(news_cctv_df)
     return markdown_table
 
 
@@ -37,10 +55,10 @@ def ak_stock_news_em(stock_code: str, start_date: str = "20250829")->str:
     start_date = pd.to_datetime(start_date)
     # 转换pub_time为日期时间格式
     stock_news_em_df["发布时间"] = pd.to_datetime(stock_news_em_df["发布时间"])
-    # 丢弃一些列
-    stock_news_em_df = stock_news_em_df[stock_news_em_df["发布时间"] >= start_date]
-    stock_news_em_df = stock_news_em_df.drop(columns=["关键词", "新闻链接"])
-    markdown_table = stock_news_em_df.to_markdown(index=False)
+    # 按时间筛选并丢弃一些列，一次索引完成，避免中间DataFrame拷贝
+    stock_news_em_df = stock_news_em_df.loc[stock_news_em_df["发布时间"] >= start_date,
+                                            stock_news_em_df.columns.drop(["关键词", "新闻链接"])]
+    markdown_table = dataframe_to_text(stock_news_em_df)
     return markdown_table
 
 
@@ -61,13 +79,13 @@ def ak_stock_news_main_cx(start_date: str = "20250829")->str:
     start_date = pd.to_datetime(start_date)
     # 转换pub_time为日期时间格式
     stock_news_main_cx_df["pub_time"] = pd.to_datetime(stock_news_main_cx_df["pub_time"])
-    # 丢弃一些列
-    stock_news_main_cx_df = stock_news_main_cx_df[stock_news_main_cx_df["pub_time"] >= start_date]
-    stock_news_main_cx_df = stock_news_main_cx_df.drop(columns=["url", "interval_time"])
+    # 按时间筛选并丢弃一些列，一次索引完成，避免中间DataFrame拷贝
+    stock_news_main_cx_df = stock_news_main_cx_df.loc[stock_news_main_cx_df["pub_time"] >= start_date,
+                                                      stock_news_main_cx_df.columns.drop(["url", "interval_time"])]
     # 重命名列
     stock_news_main_cx_df = stock_news_main_cx_df.rename(columns={"tag": "新闻标签", "summary": "新闻内容", "pub_time": "发布时间"})
-    # 转换为markdown表格
-    markdown_table = stock_news_main_cx_df.to_markdown(index=False)
+    # 转换为markdown表格，数据量大时为制表符分隔文本
+    markdown_table = dataframe_to_text(stock_news_main_cx_df)
     return markdown_table
 
 if __name__ == '__main__':
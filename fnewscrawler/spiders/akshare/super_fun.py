@@ -1,23 +1,55 @@
-import json
+import datetime
 
 import akshare as ak
+import pandas as pd
 
-from fnewscrawler.utils import parse_params2list, format_param
+from fnewscrawler.utils import parse_params2list, format_param, dataframe_to_text
+
+
+def _epoch_ms(value):
+    """单个日期/时间值转换为毫秒时间戳，与DataFrame.to_json默认的epoch格式一致"""
+    if isinstance(value, datetime.timedelta):
+        return pd.Timedelta(value).value // 1_000_000
+    return pd.Timestamp(value).value // 1_000_000
+
+
+def _to_json_records(df: pd.DataFrame) -> list[dict]:
+    """
+    DataFrame转换为记录列表，空值转为None
+    日期、时间和时间差列转换为毫秒时间戳，保持与原先to_json(orient='records')的输出格式一致
+    """
+    df = df.copy(deep=False)
+    for col in df.columns:
+        s = df[col]
+        if pd.api.types.is_datetime64_any_dtype(s.dtype) or pd.api.types.is_timedelta64_dtype(s.dtype):
+            df[col] = pd.Series([None if pd.isna(v) else _epoch_ms(v) for v in s], index=s.index, dtype=object)
+        elif s.dtype == object:
+            # akshare的日期列经常是datetime.date对象组成的object列，按第一个非空值判断整列类型
+            not_null = s.notna().to_numpy()
+            first_pos = not_null.argmax() if len(not_null) else 0
+            if (len(not_null) and not_null[first_pos]
+                    and isinstance(s.iat[first_pos], (datetime.date, datetime.timedelta))):
+                # pd.NaT也是datetime的实例，需要先排除空值，否则会被转换成一个很大的负数
+                df[col] = s.map(
+                    lambda v: _epoch_ms(v) if isinstance(v, (datetime.date, datetime.timedelta)) and not pd.isna(v)
+                    else v)
+    return df.astype(object).where(df.notna(), None).to_dict(orient='records')
 
 
 def ak_super_fun(fun_name: str, duplicate_key="", drop_columns: str = "", return_type: str = 'json',filter_condition="", limit: int  = None,
-                 sort_by: str = None, ascending: bool = True, **kwargs) -> dict | str:
+                 sort_by: str = None, ascending: bool = True, dedup: bool = False, **kwargs) -> dict | str:
     """调用akshare的函数
 
     Args:
         fun_name: akshare函数名称
         duplicate_key: 去重键，可以指定根据哪一列进行去重
         drop_columns: 要删除的列名，多个列名用逗号分隔
-        return_type: 返回类型，可选'json'或'markdown'，默认'json'
+        return_type: 返回类型，可选'json'或'markdown'，默认'json'，markdown在超过200行时返回制表符分隔的文本
         filter_condition: 筛选条件字符串
         limit: 返回数据的最大条数，None表示返回所有数据
         sort_by: 排序依据的列名，None表示不排序
         ascending: 排序方式，True为升序，False为降序
+        dedup: 是否对整行去重，默认不去重；指定了duplicate_key时总会按该列去重
         **kwargs: 函数参数
 
     Returns:
@@ -37,16 +69,17 @@ def ak_super_fun(fun_name: str, duplicate_key="", drop_columns: str = "", return
 
         # 执行函数并返回结果
         df = fun(**kwargs)
-        #去重
-        if duplicate_key in df.columns:
-            df = df.drop_duplicates(subset=[duplicate_key])
-        else:
-            df = df.drop_duplicates()
-        df = df.reset_index(drop=True)
-        #丢弃特定列
+        #按去重键去重放在丢弃列之前，去重键也可能是要丢弃的列
+        key_dedup = bool(duplicate_key) and duplicate_key in df.columns
+        if key_dedup:
+            df = df.drop_duplicates(subset=[duplicate_key]).reset_index(drop=True)
+        #丢弃特定列，缩小后续整行去重、筛选和序列化处理的数据量
         if drop_columns:
             drop_columns = parse_params2list(drop_columns, str)
-            df = df.drop(columns=drop_columns)
+            df.drop(columns=drop_columns, inplace=True)
+        #整行去重，只在显式要求或去重键不存在时进行，整行去重需要对每个单元格做哈希
+        if not key_dedup and (dedup or duplicate_key):
+            df = df.drop_duplicates().reset_index(drop=True)
         #筛选,类似与sql语句进行筛选
         if filter_condition:
             df = df.query(filter_condition)
@@ -61,10 +94,10 @@ def ak_super_fun(fun_name: str, duplicate_key="", drop_columns: str = "", return
 
         #准备格式返回
         if return_type == 'markdown':
-            df = df.to_markdown(index=False)
+            df = dataframe_to_text(df)
         elif return_type == "json":
-            df = df.to_json(orient='records', force_ascii=False)
-            df = json.loads(df)
+            # 直接转换为记录列表，省去先序列化为JSON字符串再解析回来的两次全量处理
+            df = _to_json_records(df)
         else:
             raise ValueError(f"不支持的返回类型: {return_type}, 仅支持json或者markdown")
         return df
@@ -28,6 +28,8 @@ async def get_industry_stock_funds_flow(industry_name: str,rank_type="1day")-> s
     clumns_name = ["序号", "代码", "名称", "相关","最新价", f"{head_key}涨跌幅", f"{head_key}主力净流入净额", f"{head_key}主力净流入净占比", f"{head_key}超大单净流入净额", f"{head_key}超大单净流入净占比", f"{head_key}大单净流入净额", f"{head_key}大单净流入净占比", f"{head_key}中单净流入净额", f"{head_key}中单净流入净占比", f"{head_key}小单净流入净额", f"{head_key}小单净流入净占比"]
     page = None
     dfs =[]
+    # 已经抓取过的股票代码，翻页时增量去重，避免最后再对全部数据去重
+    seen_codes = set()
     try:
         page = await context.new_page()
         await page.goto(url)
@@ -52,17 +54,19 @@ async def get_industry_stock_funds_flow(industry_name: str,rank_type="1day")-> s
         # 确保表格主体可见，避免在数据加载前抓取
         await page.locator(".dataview-body").wait_for(state="visible")
         while True:
-            # 提取表格的 HTML 字符串
+            # 在浏览器内直接取出表体每行的单元格文本，省去序列化HTML再用read_html解析的开销
             # await page.locator(".dataview-body").wait_for(state="visible")
-            table_html = await page.locator(".dataview-body").inner_html()
-            current_df = pd.read_html(StringIO(table_html))[0]
+            rows = await page.locator(".dataview-body tbody tr").evaluate_all(
+                "rows => rows.map(r => Array.from(r.cells, c => c.innerText.trim()))"
+            )
+            # 过滤掉“暂无数据”等合并单元格的行
+            rows = [row for row in rows if len(row) == len(clumns_name)]
 
-            if not current_df.empty:
+            if rows:
                     # 手动设置列名
-                    current_df.columns = clumns_name
-                    # final_df = current_df.drop_duplicates()
-                    # 使用 pandas 的 to_markdown 方法转换为 Markdown 格式
-                    # markdown_table = final_df.to_markdown(index=False)
+                    current_df = pd.DataFrame(rows, columns=clumns_name)
+                    current_df = current_df[~current_df['代码'].isin(seen_codes)]
+                    seen_codes.update(current_df['代码'])
                     dfs.append(current_df)
 
             # page_text = await page.locator(".pagerbox").inner_text()
@@ -72,10 +76,19 @@ async def get_industry_stock_funds_flow(industry_name: str,rank_type="1day")-> s
                 break
 
             if "下一页" in page_text:
+                # 翻页前记录表体内容，翻页后等待内容变化即可继续，不必固定等待
+                prev_html = await page.locator(".dataview-body tbody").inner_html()
                 await page.locator("text=下一页").click()
                 await page.wait_for_load_state("domcontentloaded")
-                #不加这个一定会有莫名其妙的问题，选择1秒还是比较激进了，后期如果有问题，考虑增大，这条语句的位置不要该，domcontentloaded不要改，换成networkidle会卡死
-                await asyncio.sleep(1)
+                try:
+                    await page.wait_for_function(
+                        "(prev) => { const b = document.querySelector('.dataview-body tbody'); return b && b.innerHTML !== prev; }",
+                        arg=prev_html,
+                        timeout=5000,
+                    )
+                except Exception:
+                    #等待表格变化超时时退回到固定等待，domcontentloaded不要改，换成networkidle会卡死
+                    await asyncio.sleep(1)
 
         if len(dfs) ==0:
             return "没有行业资金流信息"
@@ -87,7 +100,6 @@ async def get_industry_stock_funds_flow(industry_name: str,rank_type="1day")-> s
             final_df['代码'] = final_df['代码'].astype(str)
             # 使用 str.zfill() 方法补全前导零，例如，补到6位
             final_df['代码'] = final_df['代码'].str.zfill(6)
-            final_df = final_df.drop_duplicates()
             return final_df.to_markdown(index=False)
 
     except Exception as e:
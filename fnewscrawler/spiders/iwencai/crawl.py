@@ -1,12 +1,17 @@
+import os
 import re
 from datetime import datetime
 from typing import List, Dict, Optional, Tuple
 
 from fnewscrawler.core.context import context_manager
 from fnewscrawler.utils.logger import LOGGER
+from fnewscrawler.utils import run_bounded
 import asyncio
 from fnewscrawler.core.news_crawl import news_crawl_from_url
 
+# 搜索按钮所在元素的文本匹配，模块加载时编译一次
+_SEARCH_BTN_RE = re.compile(r"^加入动态板块收藏此问句$")
+
 
 async def navigate_to_page(page, target_page: int):
     """
@@ -152,7 +157,7 @@ async def iwencai_crawl_from_query(query: str, pageno: int = 1) -> List[Dict[str
         await page.locator("#searchInput").fill(query)
         
         # 点击搜索按钮
-        await page.locator("div").filter(has_text=re.compile(r"^加入动态板块收藏此问句$")).locator("i").first.click()
+        await page.locator("div").filter(has_text=_SEARCH_BTN_RE).locator("i").first.click()
         await page.wait_for_load_state("domcontentloaded")
         
         
@@ -162,18 +167,17 @@ async def iwencai_crawl_from_query(query: str, pageno: int = 1) -> List[Dict[str
         
         # 提取新闻列表
         news_list = await extract_news_list(page)
-        # 使用gather并发处理获取详细的新闻内容
+        # 有限并发获取详细的新闻内容，最大并发数默认为20
         async def process_news_item(item):
-            url = item["url"]
-            real_url,new_content = await news_crawl_from_url(url, context_type="iwencai")
+            real_url, new_content = await news_crawl_from_url(item["url"], context_type="iwencai")
             item["content"] = new_content
             item["url"] = real_url
-            return item
 
-        # 并发执行所有新闻内容获取任务
-        news_tasks = [process_news_item(item) for item in news_list]
-        news_list = await asyncio.gather(*news_tasks)
-        
+        results = await run_bounded(news_list, process_news_item, int(os.getenv("MAX_CRAWL_CONCURRENCY", 20)))
+        for item, result in zip(news_list, results):
+            if isinstance(result, Exception):
+                item["content"] = ""
+
         return news_list
 
     except Exception as e:
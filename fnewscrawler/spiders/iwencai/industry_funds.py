@@ -8,6 +8,25 @@ from fnewscrawler.core import get_redis
 from fnewscrawler.core.context import context_manager
 from fnewscrawler.utils import LOGGER
 
+# 清理单元格中的空白和百分号
+_STRIP_RE = re.compile(r'[\s%]+')
+
+
+async def _request_table_html(context, url: str) -> str | None:
+    """通过浏览器上下文的请求客户端获取表格HTML，失败或没有表格时返回None"""
+    try:
+        response = await context.request.get(url)
+        if not response.ok:
+            return None
+        # 按响应头声明的编码解码，同花顺数据页面通常是gbk
+        content_type = response.headers.get("content-type", "")
+        charset = content_type.split("charset=")[-1].strip() if "charset=" in content_type else "utf-8"
+        html = (await response.body()).decode(charset, errors="replace")
+        return html if "<table" in html else None
+    except Exception as e:
+        LOGGER.warning(f"直接请求 {url} 失败，改用页面获取: {e}")
+        return None
+
 
 async def fetch_page_data(context, url: str, rank_type: str) -> pd.DataFrame:
     """获取单页数据的辅助函数"""
@@ -18,13 +37,16 @@ async def fetch_page_data(context, url: str, rank_type: str) -> pd.DataFrame:
 
     page = None
     try:
-        page = await context.new_page()
+        # ajax接口直接返回渲染好的表格，先用上下文的请求客户端获取（共享cookie），不必打开页面
+        table_html = await _request_table_html(context, url)
+        if table_html is None:
+            page = await context.new_page()
 
-        await page.goto(url)
-        await page.wait_for_selector('table')
+            await page.goto(url)
+            await page.wait_for_selector('table')
 
-        # 获取表格HTML内容
-        table_html = await page.evaluate('() => document.querySelector("table").outerHTML')
+            # 获取表格HTML内容
+            table_html = await page.evaluate('() => document.querySelector("table").outerHTML')
 
         # 使用StringIO包装HTML字符串，避免deprecation警告
         html_io = StringIO(table_html)
@@ -34,9 +56,9 @@ async def fetch_page_data(context, url: str, rank_type: str) -> pd.DataFrame:
         df.columns = [col[1] if isinstance(col, tuple) else col for col in df.columns]
 
         # 清理数据中的特殊字符
-        for col in df.columns:
-            if df[col].dtype == object:
-                df[col] = df[col].apply(lambda x: re.sub(r'[\s%]+', '', str(x)) if pd.notnull(x) else x)
+        for col in df.select_dtypes(include='object').columns:
+            # 整列向量化替换，空值保持原样
+            df[col] = df[col].astype(str).str.replace(_STRIP_RE, '', regex=True).where(df[col].notna(), df[col])
 
         # 缓存数据，半天后过期
         if rank_type.lower() in ["3day", "5day", "10day", "20day"]:
@@ -4,6 +4,11 @@ from fnewscrawler.core import TushareDataProvider
 from fnewscrawler.utils import LOGGER
 from fnewscrawler.utils import deduplicate_text_df
 
+# 模块加载时创建一次，避免每次调用都重新进入单例的构造流程
+_PROVIDER = TushareDataProvider()
+# 精确去重后少于该条数时跳过语义去重，避免为少量新闻加载模型和计算向量
+_SEMANTIC_DEDUP_MIN_ROWS = 50
+
 
 def short_news( start_date: str, end_date: str, src: str = "10jqka"):
     """获取股票新闻数据
@@ -33,7 +38,7 @@ def short_news( start_date: str, end_date: str, src: str = "10jqka"):
     Returns:
         包含股票筹码分布数据的DataFrame
     """
-    tushare_data_provider = TushareDataProvider()
+    tushare_data_provider = _PROVIDER
     query_key = f"stock_news_{start_date}_{end_date}_{src}"
     df = tushare_data_provider.get_cached_dataframe(query_key)
     if df is not None:
@@ -44,8 +49,9 @@ def short_news( start_date: str, end_date: str, src: str = "10jqka"):
         df = pro.news(start_date=start_date, end_date=end_date, src=src)
         #第一层去重
         df = df.drop_duplicates(subset=["content"])
-        #第二层去重
-        df = deduplicate_text_df(df, "content")
+        #第二层去重，数据量较少时跳过
+        if len(df) >= _SEMANTIC_DEDUP_MIN_ROWS:
+            df = deduplicate_text_df(df, "content")
         if not df.empty:
             tushare_data_provider.cache_dataframe(query_key, df)
         return df
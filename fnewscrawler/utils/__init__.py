@@ -3,7 +3,9 @@ from .path import get_project_root
 from .user_agent import get_random_user_agent
 from .url import extract_second_level_domain
 from .params import format_param,parse_params2list
+from .table import dataframe_to_text
+from .concurrency import run_bounded
 from .text_duplicate import deduplicate_text_df,deduplicate_chinese_texts
 
 __all__ = ['LOGGER', 'get_project_root', "get_random_user_agent", "extract_second_level_domain","format_param","parse_params2list",
-           "deduplicate_text_df","deduplicate_chinese_texts"]
+           "deduplicate_text_df","deduplicate_chinese_texts","dataframe_to_text","run_bounded"]
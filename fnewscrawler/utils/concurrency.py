@@ -0,0 +1,47 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Iterable, List
+
+
+async def run_bounded(items: Iterable[Any], fn: Callable[[Any], Awaitable[Any]], max_concurrency: int) -> List[Any]:
+    """
+    以有限并发对每个元素执行异步函数，返回与items顺序一致的结果列表
+
+    固定数量的worker从队列中取元素执行，同时存在的任务数量只与最大并发数相关，与元素数量无关。
+    单个元素执行失败时对应位置的结果为该异常对象，不会影响其他元素，由调用方决定如何处理
+
+    Args:
+        items: 待处理的元素
+        fn: 对单个元素执行的异步函数
+        max_concurrency: 最大并发数
+
+    Returns:
+        List: 与items顺序一致的结果列表，失败的元素对应异常对象
+    """
+    items = list(items)
+    results: List[Any] = [None] * len(items)
+    if not items:
+        return results
+
+    queue = asyncio.Queue()
+    for index, item in enumerate(items):
+        queue.put_nowait((index, item))
+
+    async def worker():
+        while True:
+            index, item = await queue.get()
+            try:
+                results[index] = await fn(item)
+            except Exception as e:
+                # 单个元素失败不能让worker退出，否则队列中剩余的元素无人处理
+                results[index] = e
+            finally:
+                queue.task_done()
+
+    workers = [asyncio.create_task(worker()) for _ in range(max(1, min(max_concurrency, len(items))))]
+    try:
+        await queue.join()
+    finally:
+        for w in workers:
+            w.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+    return results
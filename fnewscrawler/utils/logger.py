@@ -20,9 +20,11 @@ class Logger:
             level=self.level
         )
 
-    def info(self, msg):
+    # 支持传入格式化参数（loguru的{}占位符风格），日志等级被过滤时不会执行格式化，
+    # 例如 LOGGER.error("获取状态失败: {}", e)
+    def info(self, msg, *args, **kwargs):
         if self.level == "INFO":
-            self.logger.info(msg)
+            self.logger.info(msg, *args, **kwargs)
         elif self.level == "WARNING":
             # 只输出WARNING及以上
             pass
@@ -30,14 +32,14 @@ class Logger:
             # 只输出ERROR
             pass
 
-    def warning(self, msg):
+    def warning(self, msg, *args, **kwargs):
         if self.level in ["INFO", "WARNING"]:
-            self.logger.warning(msg)
+            self.logger.warning(msg, *args, **kwargs)
         elif self.level == "ERROR":
             pass
 
-    def error(self, msg):
-        self.logger.error(msg)
+    def error(self, msg, *args, **kwargs):
+        self.logger.error(msg, *args, **kwargs)
 
 # 实例化logger对象供外部使用
 LOGGER = Logger()
\ No newline at end of file
@@ -0,0 +1,21 @@
+import pandas as pd
+
+# 超过该行数时不再生成markdown表格，tabulate逐个单元格在Python层格式化，行数多时非常慢
+MAX_MARKDOWN_ROWS = 200
+
+
+def dataframe_to_text(df: pd.DataFrame, max_markdown_rows: int = MAX_MARKDOWN_ROWS) -> str:
+    """将 DataFrame 转换为返回给大模型的表格文本
+
+    行数不超过max_markdown_rows时返回markdown表格，否则返回制表符分隔的文本（由pandas的C实现生成）
+
+    Args:
+        df (pd.DataFrame): 需要转换的数据
+        max_markdown_rows (int, optional): 生成markdown表格的最大行数，默认200
+
+    Returns:
+        str: markdown表格或制表符分隔的文本
+    """
+    if len(df) > max_markdown_rows:
+        return df.to_csv(index=False, sep='\t')
+    return df.to_markdown(index=False)
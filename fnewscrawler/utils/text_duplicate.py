@@ -1,13 +1,25 @@
+import hashlib
 import os
+import re
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import List
 
+import numpy as np
 import pandas as pd
+import torch
 from huggingface_hub import snapshot_download
-from sentence_transformers import SentenceTransformer, util
+from sentence_transformers import SentenceTransformer
 
 from fnewscrawler.utils import LOGGER
 
+# faiss为可选依赖，安装后使用近邻索引构建相似图，否则精确计算全部相似度
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
 
 def download_sentence_transformer_model(
     model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",
@@ -111,20 +123,184 @@ def download_sentence_transformer_model(
 
 # 全局缓存模型，避免重复加载
 _MODEL = None
+# 文本向量化的批大小
+_ENCODE_BATCH_SIZE = 128
+# 模型每条文本最多处理的token数，以及编码前截断的字符数，避免个别超长文本拉长整批的padding
+_MAX_SEQ_LENGTH = 128
+_MAX_TEXT_CHARS = 512
+# 文本向量缓存：文本的sha1 -> 向量，按LRU淘汰，重复抓取到的相同新闻无需再次编码
+_EMB_CACHE_SIZE = 10000
+_EMB_CACHE: "OrderedDict[bytes, torch.Tensor]" = OrderedDict()
+_EMB_CACHE_LOCK = threading.Lock()
+
+def _default_model_dir() -> Path:
+    """默认的去重模型本地路径，与download_sentence_transformer_model的默认下载路径一致"""
+    model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+    safe_model_name = model_name.replace("/", "_")
+    return Path.home() / "sentence-transformers" / safe_model_name
+
 
 def _get_model(cache_dir=None):
     global _MODEL
     if cache_dir is None:
-        home = Path.home()
-        model_name: str = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
-        safe_model_name = model_name.replace("/", "_")
-        cache_dir = home / "sentence-transformers" / safe_model_name
+        cache_dir = _default_model_dir()
     if _MODEL is None:
-        # 中文通用轻量模型
-        _MODEL = SentenceTransformer(str(cache_dir))
+        # 中文通用轻量模型，有GPU时放到GPU上并直接以半精度加载权重，否则使用CPU单精度
+        # 下载时只保留了safetensors权重，显式指定后按mmap方式加载，不会回退到pickle格式的权重文件
+        if torch.cuda.is_available():
+            _MODEL = SentenceTransformer(str(cache_dir), device="cuda",
+                                         model_kwargs={"use_safetensors": True, "torch_dtype": torch.float16})
+        else:
+            _MODEL = SentenceTransformer(str(cache_dir), device="cpu",
+                                         model_kwargs={"use_safetensors": True})
+        _MODEL.max_seq_length = _MAX_SEQ_LENGTH
     return _MODEL
 
 
+def warmup_model() -> bool:
+    """
+    预加载去重模型并做一次推理预热，避免第一次去重请求承担模型加载的耗时
+    模型文件尚未下载完成时跳过，返回是否完成预热
+    """
+    if not (_default_model_dir() / "model.safetensors").exists():
+        LOGGER.info("新闻去重模型尚未下载，跳过预热")
+        return False
+    try:
+        model = _get_model()
+        model.encode(["warmup"] * 4, batch_size=_ENCODE_BATCH_SIZE, convert_to_tensor=True,
+                     normalize_embeddings=True, show_progress_bar=False)
+        LOGGER.info("新闻去重模型预热完成")
+        return True
+    except Exception as e:
+        LOGGER.warning(f"新闻去重模型预热失败: {e}")
+        return False
+
+
+def _encode_texts(texts: List[str]) -> torch.Tensor:
+    """将文本编码为归一化向量，已编码过的文本直接从缓存读取，只对未命中的文本调用模型"""
+    # 超出模型长度的部分本来也会被截断，提前截断可以减少分词和哈希的开销
+    texts = [t[:_MAX_TEXT_CHARS] for t in texts]
+    keys = [hashlib.sha1(t.encode("utf-8")).digest() for t in texts]
+    embs = [None] * len(texts)
+    with _EMB_CACHE_LOCK:
+        for i, key in enumerate(keys):
+            emb = _EMB_CACHE.get(key)
+            if emb is not None:
+                _EMB_CACHE.move_to_end(key)
+                embs[i] = emb
+    miss_idx = [i for i, emb in enumerate(embs) if emb is None]
+
+    if miss_idx:
+        model = _get_model()
+        # 显式指定较大的batch_size提高吞吐，向量归一化后余弦相似度只需一次矩阵乘法
+        new_embs = model.encode([texts[i] for i in miss_idx], batch_size=_ENCODE_BATCH_SIZE,
+                                convert_to_tensor=True, normalize_embeddings=True, show_progress_bar=False)
+        with _EMB_CACHE_LOCK:
+            for i, emb in zip(miss_idx, new_embs):
+                # clone后缓存，避免单行向量引用整批结果导致整批内存无法释放
+                emb = emb.clone()
+                embs[i] = emb
+                _EMB_CACHE[keys[i]] = emb
+            while len(_EMB_CACHE) > _EMB_CACHE_SIZE:
+                _EMB_CACHE.popitem(last=False)
+
+    return torch.stack(embs)
+
+
+# 文本数量超过该值时faiss使用HNSW近似索引，否则使用精确的内积索引
+_HNSW_MIN_SIZE = 1000
+# faiss检索每条文本的近邻数量
+_FAISS_NEIGHBORS = 16
+# 精确计算相似度时每次参与矩阵乘法的行数，控制相似度矩阵的峰值内存
+_SIM_BLOCK_SIZE = 4096
+
+
+def _union_find_keep_mask(n: int, pairs) -> np.ndarray:
+    """对相似文本对做并查集合并，返回保留掩码，每个连通分量只保留下标最小的元素（即最早出现的一条）"""
+    parent = list(range(n))
+
+    def find(x):
+        while parent[x] != x:
+            parent[x] = parent[parent[x]]
+            x = parent[x]
+        return x
+
+    for i, j in pairs:
+        ri, rj = find(int(i)), find(int(j))
+        if ri != rj:
+            # 总是以较小的下标作为根，根即为分量中最早出现的文本
+            if ri < rj:
+                parent[rj] = ri
+            else:
+                parent[ri] = rj
+    return np.fromiter((find(i) == i for i in range(n)), dtype=bool, count=n)
+
+
+def _keep_mask(embs: torch.Tensor, threshold: float) -> np.ndarray:
+    """根据归一化向量计算保留掩码，True表示该条文本需要保留"""
+    n = len(embs)
+    if faiss is not None:
+        embs_np = embs.float().cpu().numpy()
+        dim = embs_np.shape[1]
+        # 向量已归一化，内积即余弦相似度
+        if n > _HNSW_MIN_SIZE:
+            index = faiss.IndexHNSWFlat(dim, 32, faiss.METRIC_INNER_PRODUCT)
+        else:
+            index = faiss.IndexFlatIP(dim)
+        index.add(embs_np)
+        sims, neighbors = index.search(embs_np, min(_FAISS_NEIGHBORS, n))
+        pairs = [(i, j) for i, row in enumerate(neighbors) for k, j in enumerate(row)
+                 if j >= 0 and j != i and sims[i, k] >= threshold]
+        return _union_find_keep_mask(n, pairs)
+
+    # 精确计算：向量已归一化，分块做一次矩阵乘法即得到余弦相似度，GPU上使用半精度减少显存带宽
+    if embs.is_cuda:
+        embs = embs.half()
+    pairs = []
+    for start in range(0, n, _SIM_BLOCK_SIZE):
+        sim = embs[start:start + _SIM_BLOCK_SIZE] @ embs.T
+        # 只取上三角(j > i)，每个相似对只出现一次且排除自身
+        rows = torch.arange(start, start + len(sim), device=sim.device).unsqueeze(1)
+        cols = torch.arange(n, device=sim.device).unsqueeze(0)
+        hits = ((sim >= threshold) & (cols > rows)).nonzero(as_tuple=False)
+        hits[:, 0] += start
+        pairs.extend(hits.cpu().tolist())
+    return _union_find_keep_mask(n, pairs)
+
+
+# 文本归一化时去掉空白和标点符号
+_NORMALIZE_RE = re.compile(r'[\W_]+')
+
+
+def _dedup_keep_mask(texts: List[str], threshold: float) -> np.ndarray:
+    """
+    两阶段去重，返回保留掩码：
+    先按归一化后的文本做精确去重（转载的同一篇新闻通常只有空白和标点差异），
+    只有剩下的代表文本才需要模型编码和语义去重
+    """
+    # 不足两条时不可能有重复，无需加载模型
+    if len(texts) < 2:
+        return np.ones(len(texts), dtype=bool)
+
+    first_seen = {}
+    rep_idx = []
+    for i, text in enumerate(texts):
+        key = _NORMALIZE_RE.sub('', text).lower()
+        if key not in first_seen:
+            first_seen[key] = i
+            rep_idx.append(i)
+    rep_idx = np.asarray(rep_idx, dtype=np.int64)
+
+    keep_mask = np.zeros(len(texts), dtype=bool)
+    # 精确去重后只剩一条代表文本时同样无需语义去重
+    if len(rep_idx) < 2:
+        keep_mask[rep_idx] = True
+        return keep_mask
+    embs = _encode_texts([texts[i] for i in rep_idx])
+    keep_mask[rep_idx[_keep_mask(embs, threshold)]] = True
+    return keep_mask
+
+
 def deduplicate_text_df(df: pd.DataFrame,
                         text_col: str,
                         threshold: float = 0.8) -> pd.DataFrame:
@@ -148,17 +324,9 @@ def deduplicate_text_df(df: pd.DataFrame,
         return df
 
     texts = df[text_col].astype(str).tolist()
-    model = _get_model()
-    embs = model.encode(texts, convert_to_tensor=True, show_progress_bar=False)
+    keep_mask = _dedup_keep_mask(texts, threshold)
 
-    clusters = util.community_detection(embs, threshold=threshold, min_community_size=2)
-    keep_indices = set()
-    for c in clusters:
-        keep_indices.add(c[0])
-    # 单篇未聚类也算保留
-    keep_indices.update(set(range(len(texts))) - {i for c in clusters for i in c})
-
-    return df.iloc[sorted(keep_indices)].reset_index(drop=True)
+    return df.take(np.flatnonzero(keep_mask)).reset_index(drop=True)
 
 
 def deduplicate_chinese_texts(texts: List[str],
@@ -179,13 +347,6 @@ def deduplicate_chinese_texts(texts: List[str],
     if not texts:
         return []
 
-    model = _get_model()
-    embs = model.encode(texts, convert_to_tensor=True, show_progress_bar=False)
-
-    clusters = util.community_detection(embs, threshold=threshold, min_community_size=2)
-    keep_indices = set()
-    for c in clusters:
-        keep_indices.add(c[0])
-    keep_indices.update(set(range(len(texts))) - {i for c in clusters for i in c})
+    keep_mask = _dedup_keep_mask(texts, threshold)
 
-    return [texts[i] for i in sorted(keep_indices)]
+    return [text for text, keep in zip(texts, keep_mask) if keep]
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from urllib.parse import urlparse
 
 def extract_second_level_domain(url: str) -> str | None:
@@ -28,6 +29,19 @@ def extract_second_level_domain(url: str) -> str | None:
         if not netloc:
             return None
 
+        # 同一批次的新闻链接大多来自少数几个站点，按域名缓存解析结果
+        return _second_level_domain_from_netloc(netloc)
+
+    except Exception as e:
+        # 捕获解析过程中的异常
+        print(f"Error parsing URL '{url}': {e}")
+        return None
+
+
+@lru_cache(maxsize=4096)
+def _second_level_domain_from_netloc(netloc: str) -> str | None:
+    """从网络位置（host[:port]）中提取二级域名名称"""
+    try:
         # 移除端口号（如果存在）
         if ':' in netloc:
             netloc = netloc.split(':')[0]
@@ -63,5 +77,5 @@ def extract_second_level_domain(url: str) -> str | None:
 
     except Exception as e:
         # 捕获解析过程中的异常
-        print(f"Error parsing URL '{url}': {e}")
+        print(f"Error parsing netloc '{netloc}': {e}")
         return None
\ No newline at end of file
@@ -6,6 +6,7 @@ FNewsCrawler Web应用启动脚本
 快速启动FastAPI Web应用
 """
 
+import importlib.util
 import uvicorn
 import sys
 import os
@@ -49,6 +50,12 @@ def main():
             "log_level": "info",
             "access_log": True
         }
+        # 非Windows平台显式使用uvloop事件循环和httptools解析HTTP，未安装时仍由uvicorn自动选择
+        if sys.platform != 'win32':
+            if importlib.util.find_spec("uvloop"):
+                config["loop"] = "uvloop"
+            if importlib.util.find_spec("httptools"):
+                config["http"] = "httptools"
 
         LOGGER.info(f"Web应用将在 http://{host_addr}:{port} 启动")
         LOGGER.info(f"API文档地址: http://{host_addr}:{port}/docs")
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+
+from fnewscrawler.mcp.indicator.kdj import calc_kdj
+from fnewscrawler.mcp.indicator.macd import calc_macd
+
+
+def _daily_data(rows: int = 120, seed: int = 0) -> pd.DataFrame:
+    """固定随机种子生成日线数据，中间插入一段一字板(最高价等于最低价)覆盖RSV除零的分支"""
+    rng = np.random.default_rng(seed)
+    close = 10 + np.cumsum(rng.normal(scale=0.2, size=rows))
+    high = close + rng.uniform(0, 0.3, size=rows)
+    low = close - rng.uniform(0, 0.3, size=rows)
+    high[40:52] = low[40:52] = close[40:52] = close[40]
+    return pd.DataFrame({
+        'trade_date': pd.date_range('2024-01-01', periods=rows).strftime('%Y%m%d'),
+        'high': high,
+        'low': low,
+        'close': close,
+    })
+
+
+def _loop_kdj(data: pd.DataFrame, fastk_period: int, slowk_period: int, slowd_period: int) -> pd.DataFrame:
+    """改为ewm之前逐行递推的实现，作为对照"""
+    data = data.copy()
+    data['LLV'] = data['low'].rolling(window=fastk_period).min()
+    data['HHV'] = data['high'].rolling(window=fastk_period).max()
+    rsv_raw = (data['close'] - data['LLV']) / (data['HHV'] - data['LLV']) * 100
+    data['RSV'] = rsv_raw.fillna(0).clip(0, 100)
+
+    k_values = []
+    d_values = []
+    for i in range(len(data)):
+        rsv = data['RSV'].iloc[i]
+        if i == 0:
+            k = 50.0
+            d = 50.0
+        else:
+            prev_k = k_values[-1]
+            prev_d = d_values[-1]
+            k = ((slowk_period - 1) * prev_k + rsv) / slowk_period
+            d = ((slowd_period - 1) * prev_d + k) / slowd_period
+        k_values.append(k)
+        d_values.append(d)
+    data['K'] = k_values
+    data['D'] = d_values
+    data['J'] = 3 * data['K'] - 2 * data['D']
+    return data[['trade_date', 'K', 'D', 'J']].iloc[fastk_period - 1:].reset_index(drop=True).dropna()
+
+
+def _loop_ema(series: pd.Series, period: int) -> np.ndarray:
+    alpha = 2.0 / (period + 1)
+    ema = np.zeros(len(series)) * np.nan
+    for i in range(len(series)):
+        if i == 0:
+            ema[i] = series.iloc[i]
+        else:
+            ema[i] = alpha * series.iloc[i] + (1 - alpha) * ema[i - 1]
+    return ema
+
+
+def _loop_macd(data: pd.DataFrame, fastperiod: int, slowperiod: int, signalperiod: int) -> pd.DataFrame:
+    """改为ewm之前逐行递推的实现，作为对照"""
+    close = pd.to_numeric(data['close'], errors='coerce')
+    dif = _loop_ema(close, fastperiod) - _loop_ema(close, slowperiod)
+    dea = _loop_ema(pd.Series(dif), signalperiod)
+    result_df = pd.DataFrame({
+        'trade_date': data['trade_date'],
+        'DIF': np.round(dif, 4),
+        'DEA': np.round(dea, 4),
+        'MACD': np.round((dif - dea) * 2, 4),
+    })
+    return result_df.iloc[slowperiod - 1:].reset_index(drop=True)
+
+
+def test_kdj_matches_loop():
+    for seed, periods in [(0, (9, 3, 3)), (1, (14, 5, 4)), (2, (5, 2, 6))]:
+        data = _daily_data(seed=seed)
+        expected = _loop_kdj(data, *periods)
+        result = calc_kdj(data, *periods)
+        assert result['trade_date'].tolist() == expected['trade_date'].tolist()
+        for col in ['K', 'D', 'J']:
+            assert np.allclose(result[col].to_numpy(), expected[col].to_numpy(), rtol=0, atol=1e-9)
+
+
+def test_macd_matches_loop():
+    for seed, periods in [(0, (12, 26, 9)), (1, (5, 35, 5)), (2, (6, 13, 4))]:
+        data = _daily_data(seed=seed)
+        expected = _loop_macd(data, *periods)
+        result = calc_macd(data, *periods)
+        assert result['trade_date'].tolist() == expected['trade_date'].tolist()
+        for col in ['DIF', 'DEA', 'MACD']:
+            # 结果保留4位小数，浮点误差恰好落在舍入边界时允许相差一个最小单位
+            assert np.allclose(result[col].to_numpy(), expected[col].to_numpy(), rtol=0, atol=1e-4 + 1e-12)
+
+
+def test_calc_kdj_keeps_input():
+    data = _daily_data()
+    columns = data.columns.tolist()
+    calc_kdj(data)
+    assert data.columns.tolist() == columns
+
+
+if __name__ == '__main__':
+    test_kdj_matches_loop()
+    test_macd_matches_loop()
+    test_calc_kdj_keeps_input()
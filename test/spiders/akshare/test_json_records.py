@@ -0,0 +1,43 @@
+import datetime
+import json
+
+import numpy as np
+import pandas as pd
+
+from fnewscrawler.spiders.akshare.super_fun import _to_json_records
+
+
+def _legacy_records(df: pd.DataFrame) -> list[dict]:
+    """改动前的实现：先序列化为JSON字符串再解析回来"""
+    return json.loads(df.to_json(orient='records', force_ascii=False))
+
+
+def test_json_records_matches_to_json():
+    df = pd.DataFrame({
+        "名称": ["平安银行", None, "万科A", "贵州茅台"],
+        "日期": [datetime.date(2025, 8, 1), datetime.date(2025, 8, 4), None, pd.NaT],
+        "时间": pd.to_datetime(["2025-08-01 09:30:00", None, "2025-08-05 15:00:00", "2025-08-06"]),
+        "最新价": [12.5, np.nan, 8.25, 1500.0],
+        "成交量": [100, 200, 300, 400],
+        "停牌时长": pd.to_timedelta(["1 days", None, "2 hours", "30 min"]),
+    })
+    assert _to_json_records(df) == _legacy_records(df)
+
+
+def test_json_records_object_column_leading_null():
+    # 第一个值为空时，按第一个非空值判断整列类型
+    df = pd.DataFrame({"日期": [None, pd.NaT, datetime.date(2025, 8, 1)]})
+    assert _to_json_records(df) == _legacy_records(df)
+
+
+def test_json_records_nat_is_null():
+    df = pd.DataFrame({"日期": [datetime.datetime(2025, 8, 1), pd.NaT]}, dtype=object)
+    records = _to_json_records(df)
+    assert records[1]["日期"] is None
+    assert records == _legacy_records(df)
+
+
+if __name__ == '__main__':
+    test_json_records_matches_to_json()
+    test_json_records_object_column_leading_null()
+    test_json_records_nat_is_null()
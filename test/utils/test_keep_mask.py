@@ -0,0 +1,105 @@
+import numpy as np
+import torch
+from sentence_transformers import util
+
+from fnewscrawler.utils import text_duplicate
+from fnewscrawler.utils.text_duplicate import _keep_mask, _union_find_keep_mask
+
+THRESHOLD = 0.9
+
+
+def _greedy_keep_mask(embs: torch.Tensor, threshold: float) -> np.ndarray:
+    """
+    按顺序贪心去重的参照实现：保留每条未被删除的文本，删除其后与之相似的文本
+
+    注意这不是改动前的实现，改动前使用util.community_detection，每个社区保留社区列表中的第一条，
+    与现在保留下标最小的一条不一定相同；两者只在簇之间相互远离时结果一致
+    """
+    sim = (embs @ embs.T).cpu().numpy()
+    n = len(embs)
+    keep = np.ones(n, dtype=bool)
+    removed = np.zeros(n, dtype=bool)
+    for i in range(n):
+        if removed[i]:
+            continue
+        for j in range(i + 1, n):
+            if sim[i, j] >= threshold:
+                removed[j] = True
+                keep[j] = False
+    return keep
+
+
+def _clustered_embs(seed: int = 0) -> torch.Tensor:
+    """构造互相远离的若干簇，簇内相似度高于阈值、簇间接近正交，簇成员在序列中交错出现"""
+    rng = np.random.default_rng(seed)
+    dim = 32
+    centers = np.eye(dim)[:6]
+    labels = rng.integers(0, len(centers), size=40)
+    vecs = centers[labels] + rng.normal(scale=0.02, size=(len(labels), dim))
+    vecs /= np.linalg.norm(vecs, axis=1, keepdims=True)
+    return torch.from_numpy(vecs.astype(np.float32))
+
+
+def _keep_mask_exact(embs: torch.Tensor, threshold: float) -> np.ndarray:
+    # 临时屏蔽faiss，覆盖分块矩阵乘法路径
+    saved = text_duplicate.faiss
+    text_duplicate.faiss = None
+    try:
+        return _keep_mask(embs, threshold)
+    finally:
+        text_duplicate.faiss = saved
+
+
+def test_keep_mask_matches_greedy():
+    for seed in range(5):
+        embs = _clustered_embs(seed)
+        expected = _greedy_keep_mask(embs, THRESHOLD)
+        assert np.array_equal(_keep_mask_exact(embs, THRESHOLD), expected)
+        assert np.array_equal(_keep_mask(embs, THRESHOLD), expected)
+
+
+def test_keep_mask_vs_community_detection():
+    # 与改动前实际使用的社区检测对比：簇之间相互远离时划分一致，每个社区只保留一条，且保留的是下标最小的一条
+    for seed in range(5):
+        embs = _clustered_embs(seed)
+        mask = _keep_mask_exact(embs, THRESHOLD)
+        communities = util.community_detection(embs, threshold=THRESHOLD, min_community_size=2)
+        clustered = set()
+        for community in communities:
+            kept = [i for i in community if mask[i]]
+            assert kept == [min(community)]
+            clustered.update(community)
+        # 不属于任何社区的单篇文本都保留
+        assert all(mask[i] for i in range(len(embs)) if i not in clustered)
+
+
+def test_keep_mask_block_boundary():
+    # 分块大小小于文本数量时，跨块的相似对也要被找到
+    embs = _clustered_embs(1)
+    saved = text_duplicate._SIM_BLOCK_SIZE
+    text_duplicate._SIM_BLOCK_SIZE = 7
+    try:
+        assert np.array_equal(_keep_mask_exact(embs, THRESHOLD), _greedy_keep_mask(embs, THRESHOLD))
+    finally:
+        text_duplicate._SIM_BLOCK_SIZE = saved
+
+
+def test_union_find_keeps_earliest():
+    # 乱序给出的相似对，每个连通分量保留下标最小的一条
+    mask = _union_find_keep_mask(7, [(5, 3), (3, 1), (6, 4), (2, 2)])
+    assert mask.tolist() == [True, True, True, False, True, False, False]
+
+
+def test_union_find_merges_chain():
+    # 链式相似(0~1, 1~2但0与2不相似)：并查集合并为一个分量只保留0；
+    # 贪心去重会保留0和2，改动前的社区检测要求社区内每条都与中心相似，也不会把0和2放进同一个社区
+    mask = _union_find_keep_mask(3, [(0, 1), (1, 2)])
+    assert mask.tolist() == [True, False, False]
+
+
+if __name__ == '__main__':
+    test_keep_mask_matches_greedy()
+    test_keep_mask_vs_community_detection()
+    test_keep_mask_block_boundary()
+    test_union_find_keeps_earliest()
+    test_union_find_merges_chain()
@@ -0,0 +1,39 @@
+import pandas as pd
+
+from fnewscrawler.utils.table import MAX_MARKDOWN_ROWS, dataframe_to_text
+
+
+def _make_df(rows: int) -> pd.DataFrame:
+    return pd.DataFrame({
+        "日期": [f"2024-01-{i % 28 + 1:02d}" for i in range(rows)],
+        "名称": [f"股票{i}" for i in range(rows)],
+        "收盘": [10.0 + i * 0.01 for i in range(rows)],
+    })
+
+
+def test_markdown_at_threshold():
+    # 不超过阈值时与改动前一致，仍为markdown表格
+    df = _make_df(MAX_MARKDOWN_ROWS)
+    assert dataframe_to_text(df) == df.to_markdown(index=False)
+
+
+def test_tsv_above_threshold():
+    # 超过阈值时切换为制表符分隔文本，表头和每一行各占一行
+    df = _make_df(MAX_MARKDOWN_ROWS + 1)
+    text = dataframe_to_text(df)
+    assert text == df.to_csv(index=False, sep='\t')
+    lines = text.splitlines()
+    assert lines[0] == "日期\t名称\t收盘"
+    assert len(lines) == MAX_MARKDOWN_ROWS + 2
+
+
+def test_custom_threshold():
+    df = _make_df(10)
+    assert dataframe_to_text(df, max_markdown_rows=9) == df.to_csv(index=False, sep='\t')
+    assert dataframe_to_text(df, max_markdown_rows=10) == df.to_markdown(index=False)
+
+
+if __name__ == '__main__':
+    test_markdown_at_threshold()
+    test_tsv_above_threshold()
+    test_custom_threshold()
@@ -0,0 +1,62 @@
+import asyncio
+
+import orjson
+
+from web.api.monitor import _STREAM_CONTEXTS_BATCH, _STREAM_CONTEXTS_THRESHOLD, _stream_overview
+
+
+def _envelope(context_count: int, with_stats: bool = True) -> dict:
+    """按get_services_overview的结构构造概览响应，站点名包含中文和需要转义的字符"""
+    contexts = {
+        f"站点_{i}\"\\": {
+            "created_at": 1700000000.0 + i,
+            "last_used": 1700000100.5 + i,
+            "page_count": i % 7,
+            "cookies": [{"name": "sid", "value": f"v{i}"}],
+        }
+        for i in range(context_count)
+    }
+    context_status = {"contexts": contexts}
+    if with_stats:
+        context_status = {"status": "healthy", "total_contexts": context_count, **context_status}
+    return {
+        "success": True,
+        "message": "获取服务概览成功",
+        "data": {
+            "timestamp": "2025-07-27 11:57:57",
+            "overall_status": "healthy",
+            "services": {
+                "browser": {"status": "healthy", "pid": None},
+                "context": context_status,
+            }
+        }
+    }
+
+
+def _collect(envelope: dict) -> bytes:
+    async def run():
+        return b"".join([chunk async for chunk in _stream_overview(envelope)])
+    return asyncio.run(run())
+
+
+def test_stream_matches_dumps():
+    # 覆盖刚超过阈值、恰好整批和不足一批的情况
+    for count in [_STREAM_CONTEXTS_THRESHOLD + 1, _STREAM_CONTEXTS_BATCH * 6, _STREAM_CONTEXTS_BATCH * 6 + 3]:
+        envelope = _envelope(count)
+        expected = orjson.dumps(envelope)
+        assert _collect(envelope) == expected
+        # 流式输出过程中临时替换的字段需要还原
+        assert orjson.dumps(envelope) == expected
+
+
+def test_stream_without_stats():
+    # context中只有contexts字段时，开头不能多出逗号
+    envelope = _envelope(_STREAM_CONTEXTS_THRESHOLD + 1, with_stats=False)
+    body = _collect(envelope)
+    assert body == orjson.dumps(envelope)
+    assert orjson.loads(body) == envelope
+
+
+if __name__ == '__main__':
+    test_stream_matches_dumps()
+    test_stream_without_stats()
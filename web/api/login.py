@@ -10,6 +10,7 @@ from fastapi import APIRouter, HTTPException, BackgroundTasks
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import asyncio
+import secrets
 import time
 from datetime import datetime
 
@@ -25,6 +26,19 @@ login_instances: Dict[str, Any] = {}
 login_tasks: Dict[str, Dict[str, Any]] = {}
 
 
+# 超时后仍保留登录任务的时间（秒），期间轮询的客户端仍能拿到“登录超时”响应并由状态接口负责关闭登录实例
+_LOGIN_TASK_PRUNE_GRACE = 600
+
+
+def _prune_expired_login_tasks() -> None:
+    """清理超时已久的登录任务，避免从未被轮询的任务一直占用内存"""
+    current_time = time.time()
+    expired = [task_id for task_id, task_info in login_tasks.items()
+               if current_time - task_info["start_time"] > task_info["timeout"] + _LOGIN_TASK_PRUNE_GRACE]
+    for task_id in expired:
+        del login_tasks[task_id]
+
+
 class QRLoginRequest(BaseModel):
     """二维码登录请求模型"""
     platform: str = "iwencai"
@@ -129,8 +143,11 @@ async def start_qr_login(request: QRLoginRequest):
                 data={"status": "logged_in"}
             )
         
+        # 顺便清理已超时的旧任务
+        _prune_expired_login_tasks()
+
         # 生成任务ID
-        task_id = f"qr_login_{platform}_{int(time.time())}"
+        task_id = f"qr_login_{platform}_{secrets.token_hex(8)}"
         
         # 保存任务信息
         login_tasks[task_id] = {
@@ -314,6 +331,7 @@ async def clear_login_cache(platform: str):
 async def get_active_tasks():
     """获取活跃的登录任务"""
     try:
+        _prune_expired_login_tasks()
         current_time = time.time()
         active_tasks = []
         
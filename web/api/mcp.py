@@ -11,16 +11,13 @@ from typing import Optional
 from fastapi import APIRouter, HTTPException, Request
 from pydantic import BaseModel
 
-from fnewscrawler.mcp.mcp_manager import MCPManager
+from fnewscrawler.mcp.mcp_manager import mcp_manager
 from fnewscrawler.spiders.akshare import ak_super_fun
 from fnewscrawler.utils.logger import LOGGER
 
 # 创建路由器
 router = APIRouter()
 
-# 创建MCP管理器实例
-mcp_manager = MCPManager()
-
 
 class MCPToolInfo(BaseModel):
     """MCP工具信息模型"""
@@ -312,6 +309,7 @@ async def call_akshare_tool(fun_name: str, request: Request):
         limit = params.pop("limit", None)
         sort_by = params.pop("sort_by", None)
         ascending = params.pop("ascending", True)
+        dedup = params.pop("dedup", "")
 
 
         # 处理limit参数类型转换
@@ -330,6 +328,9 @@ async def call_akshare_tool(fun_name: str, request: Request):
         else:
             ascending = True
 
+        # 处理dedup参数类型转换
+        dedup = str(dedup).lower() in ('true', '1', 'yes', 'on')
+
         result =  ak_super_fun(
             fun_name=fun_name,
             duplicate_key=duplicate_key,
@@ -339,6 +340,7 @@ async def call_akshare_tool(fun_name: str, request: Request):
             limit=limit,
             sort_by=sort_by,
             ascending=ascending,
+            dedup=dedup,
             **params
         )
 
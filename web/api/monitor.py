@@ -6,102 +6,219 @@
 提供browser和context服务的状态监控和管理接口
 """
 
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from typing import Annotated, Optional, List
 import asyncio
 import os
 import re
+import time
+from contextvars import ContextVar
+import msgspec
+import orjson
 from datetime import datetime, timedelta
 
-from fnewscrawler.core.browser import BrowserManager
+from fnewscrawler.core.browser import browser_manager
 from fnewscrawler.core.context import context_manager
 from fnewscrawler.utils.logger import LOGGER
 
-# 创建路由器
-router = APIRouter()
+# 创建路由器，响应统一使用orjson序列化
+router = APIRouter(default_response_class=ORJSONResponse)
 
-# 全局browser manager实例
-browser_manager = BrowserManager()
+# 日志解析用的正则，模块加载时编译一次，避免逐行解析时重复查找/编译
+# 匹配常见的日志时间格式：2025-07-27 11:57:57.875
+_LOG_DATETIME_RE = re.compile(r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?:\.\d+)?')
+# 匹配常见的日志级别格式：| INFO |, | ERROR |, | WARNING |, | DEBUG |
+_LOG_LEVEL_RE = re.compile(r'\|\s*(DEBUG|INFO|WARNING|ERROR|CRITICAL)\s*\|', re.IGNORECASE)
+# 备用匹配：直接匹配级别关键词
+_LOG_LEVEL_FALLBACK_RE = re.compile(r'\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b', re.IGNORECASE)
 
-class ServiceStatusResponse(BaseModel):
-    """服务状态响应模型"""
-    success: bool
-    message: str
-    data: Optional[Dict[str, Any]] = None
+# 秒级时间戳字符串缓存：[秒数, 格式化结果]，同一秒内的请求直接复用
+_now_iso_cache = [0, ""]
 
-class ServiceActionRequest(BaseModel):
+def _now_iso() -> str:
+    """返回当前时间的ISO格式字符串（精确到秒），只在跨秒时重新格式化"""
+    now = int(time.time())
+    if now != _now_iso_cache[0]:
+        _now_iso_cache[1] = datetime.fromtimestamp(now).isoformat(timespec="seconds")
+        _now_iso_cache[0] = now
+    return _now_iso_cache[1]
+
+# 错误响应的JSON模板，message和data单独用orjson序列化后填入，直接返回字节内容
+_ERROR_TEMPLATE = b'{"success":false,"message":%s,"data":%s}'
+
+def _error_response(message: str, data: dict) -> Response:
+    """构造success为false的错误响应，跳过响应类的二次处理"""
+    return Response(
+        content=_ERROR_TEMPLATE % (orjson.dumps(message), orjson.dumps(data)),
+        media_type="application/json"
+    )
+
+# 请求级时间戳：每个HTTP请求在独立的任务中处理，ContextVar的值只在本次请求内可见
+_REQUEST_TS: ContextVar[Optional[str]] = ContextVar("monitor_request_ts", default=None)
+
+def _request_ts() -> str:
+    """返回本次请求的时间戳，同一请求内多次调用只读取一次时间"""
+    ts = _REQUEST_TS.get()
+    if ts is None:
+        ts = _now_iso()
+        _REQUEST_TS.set(ts)
+    return ts
+
+class ServiceActionRequest(msgspec.Struct):
     """服务操作请求模型"""
     action: str  # restart, cleanup, etc.
     target: Optional[str] = None  # 目标上下文名称（可选）
 
-@router.get("/browser/status")
-async def get_browser_status():
-    """获取浏览器服务状态"""
+# msgspec校验错误信息中的字段名和字段路径
+_MSGSPEC_MISSING_RE = re.compile(r"missing required field `(\w+)`")
+_MSGSPEC_PATH_RE = re.compile(r"at `\$((?:\.\w+|\[\d+\])*)`")
+_MSGSPEC_PATH_PART_RE = re.compile(r"\.(\w+)|\[(\d+)\]")
+
+def _msgspec_error_detail(error: msgspec.DecodeError) -> list:
+    """将msgspec的解码错误转换为与FastAPI请求体校验一致的422 detail列表结构"""
+    message = str(error)
+    if not isinstance(error, msgspec.ValidationError):
+        return [{"type": "json_invalid", "loc": ["body", 0], "msg": "JSON decode error",
+                 "input": {}, "ctx": {"error": message}}]
+
+    loc = ["body"]
+    path = _MSGSPEC_PATH_RE.search(message)
+    if path:
+        loc += [name or int(index) for name, index in _MSGSPEC_PATH_PART_RE.findall(path.group(1))]
+    missing = _MSGSPEC_MISSING_RE.search(message)
+    if missing:
+        return [{"type": "missing", "loc": loc + [missing.group(1)], "msg": "Field required", "input": None}]
+    return [{"type": "value_error", "loc": loc, "msg": message, "input": None}]
+
+async def _decode_action(request: Request) -> ServiceActionRequest:
+    """用msgspec直接从请求体字节解码并校验操作请求，校验失败时返回与FastAPI一致结构的422错误"""
+    body = await request.body()
+    if not body:
+        raise RequestValidationError([{"type": "missing", "loc": ["body"], "msg": "Field required", "input": None}])
     try:
-        browser_info = await browser_manager.get_browser_info()
-        
-        return ServiceStatusResponse(
-            success=True,
-            message="获取浏览器状态成功",
-            data={
-                "service": "browser",
-                "timestamp": datetime.now().isoformat(),
-                **browser_info
+        return msgspec.json.decode(body, type=ServiceActionRequest)
+    except msgspec.DecodeError as e:
+        raise RequestValidationError(_msgspec_error_detail(e))
+
+# 请求体通过依赖解码，FastAPI无法自动生成文档，手动声明请求体的JSON Schema
+_ACTION_REQUEST_OPENAPI = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {
+                "schema": msgspec.json.schema_components([ServiceActionRequest])[1]["ServiceActionRequest"]
             }
-        )
-        
+        }
+    }
+}
+
+ActionRequest = Annotated[ServiceActionRequest, Depends(_decode_action)]
+
+# /overview和/health/deep的探测结果缓存时间（秒），多个轮询客户端在缓存期内共用一次探测
+_PROBE_CACHE_TTL = float(os.getenv("HEALTH_CHECK_CACHE_TTL", 0.5))
+_probe_cache = None  # (缓存时间, (browser_info, context_stats))
+_probe_lock = asyncio.Lock()
+
+async def _safe(coro):
+    """执行协程，异常时返回异常对象而不是抛出，避免TaskGroup中一个探测失败取消另一个"""
+    try:
+        return await coro
+    except Exception as e:
+        return e
+
+async def _probe_services():
+    """并发探测浏览器和上下文服务，返回(browser_info, context_stats)，探测失败的一项为对应的异常对象"""
+    global _probe_cache
+    cached = _probe_cache
+    if cached and time.monotonic() - cached[0] < _PROBE_CACHE_TTL:
+        return cached[1]
+
+    async with _probe_lock:
+        # 双重检查，等待锁期间其他请求可能已经完成探测
+        cached = _probe_cache
+        if cached and time.monotonic() - cached[0] < _PROBE_CACHE_TTL:
+            return cached[1]
+
+        async with asyncio.TaskGroup() as tg:
+            browser_task = tg.create_task(_safe(browser_manager.get_browser_info()))
+            context_task = tg.create_task(_safe(context_manager.get_context_stats()))
+        result = (browser_task.result(), context_task.result())
+        _probe_cache = (time.monotonic(), result)
+        return result
+
+async def _wrap_service(service: str, description: str, probe):
+    """
+    调用服务状态探测函数，统一包装成响应结构并打上时间戳，
+    探测异常时记录日志并返回错误响应
+    """
+    try:
+        result = await probe()
+        # 用update合并状态字典，省去**解包时构造中间字典的开销
+        data = {"service": service, "timestamp": _request_ts()}
+        data.update(result)
+        return {
+            "success": True,
+            "message": f"{description}成功",
+            "data": data
+        }
     except Exception as e:
-        LOGGER.error(f"获取浏览器状态失败: {e}")
-        return ServiceStatusResponse(
-            success=False,
-            message=f"获取浏览器状态失败: {str(e)}",
-            data={
-                "service": "browser",
+        LOGGER.error("{}失败: {}", description, e)
+        return _error_response(
+            f"{description}失败: {str(e)}",
+            {
+                "service": service,
                 "status": "error",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _request_ts()
             }
         )
 
+@router.get("/browser/status")
+async def get_browser_status():
+    """获取浏览器服务状态"""
+    return await _wrap_service("browser", "获取浏览器状态", browser_manager.get_browser_info)
+
 @router.get("/context/status")
 async def get_context_status():
     """获取上下文管理器状态"""
-    try:
-        context_stats = await context_manager.get_context_stats()
-        
-        return ServiceStatusResponse(
-            success=True,
-            message="获取上下文状态成功",
-            data={
-                "service": "context",
-                "timestamp": datetime.now().isoformat(),
-                **context_stats
-            }
-        )
-        
-    except Exception as e:
-        LOGGER.error(f"获取上下文状态失败: {e}")
-        return ServiceStatusResponse(
-            success=False,
-            message=f"获取上下文状态失败: {str(e)}",
-            data={
-                "service": "context",
-                "status": "error",
-                "timestamp": datetime.now().isoformat()
-            }
+    return await _wrap_service("context", "获取上下文状态", context_manager.get_context_stats)
+
+# /overview中上下文数量超过该值时使用流式响应
+_STREAM_CONTEXTS_THRESHOLD = 200
+# 流式响应时每批序列化的上下文数量
+_STREAM_CONTEXTS_BATCH = 50
+
+async def _stream_overview(envelope: dict):
+    """
+    流式输出概览响应，结果与直接序列化envelope完全一致：
+    先输出除contexts外的部分，再逐批输出各站点的上下文信息
+    """
+    context_status = envelope["data"]["services"]["context"]
+    contexts = context_status["contexts"]
+    # contexts之外的上下文统计字段，序列化后去掉末尾context/services/data/根对象的4个右括号，以便接着写入contexts
+    head_status = {k: v for k, v in context_status.items() if k != "contexts"}
+    envelope["data"]["services"]["context"] = head_status
+    head = orjson.dumps(envelope)
+    envelope["data"]["services"]["context"] = context_status
+    yield head[:-4] + (b',"contexts":{' if head_status else b'"contexts":{')
+
+    items = list(contexts.items())
+    for start in range(0, len(items), _STREAM_CONTEXTS_BATCH):
+        chunk = b",".join(
+            orjson.dumps(site_name) + b":" + orjson.dumps(info)
+            for site_name, info in items[start:start + _STREAM_CONTEXTS_BATCH]
         )
+        yield (b"," + chunk) if start else chunk
+
+    yield b"}}}}}"
 
 @router.get("/overview")
 async def get_services_overview():
     """获取所有服务的概览状态"""
     try:
         # 并发获取两个服务的状态
-        browser_task = asyncio.create_task(browser_manager.get_browser_info())
-        context_task = asyncio.create_task(context_manager.get_context_stats())
-        
-        browser_info, context_stats = await asyncio.gather(
-            browser_task, context_task, return_exceptions=True
-        )
+        browser_info, context_stats = await _probe_services()
         
         # 处理browser结果
         if isinstance(browser_info, Exception):
@@ -127,26 +244,30 @@ async def get_services_overview():
             context_status.get("total_contexts", 0) >= 0
         )
         
-        return ServiceStatusResponse(
-            success=True,
-            message="获取服务概览成功",
-            data={
-                "timestamp": datetime.now().isoformat(),
+        envelope = {
+            "success": True,
+            "message": "获取服务概览成功",
+            "data": {
+                "timestamp": _request_ts(),
                 "overall_status": "healthy" if overall_healthy else "degraded",
                 "services": {
                     "browser": browser_status,
                     "context": context_status
                 }
             }
-        )
+        }
+        # 上下文数量较多时流式输出，逐批序列化各站点的上下文信息，避免一次性拼出完整响应体
+        contexts = context_status.get("contexts")
+        if isinstance(contexts, dict) and len(contexts) > _STREAM_CONTEXTS_THRESHOLD:
+            return StreamingResponse(_stream_overview(envelope), media_type="application/json")
+        return envelope
         
     except Exception as e:
-        LOGGER.error(f"获取服务概览失败: {e}")
-        return ServiceStatusResponse(
-            success=False,
-            message=f"获取服务概览失败: {str(e)}",
-            data={
-                "timestamp": datetime.now().isoformat(),
+        LOGGER.error("获取服务概览失败: {}", e)
+        return _error_response(
+            f"获取服务概览失败: {str(e)}",
+            {
+                "timestamp": _request_ts(),
                 "overall_status": "error"
             }
         )
@@ -158,215 +279,202 @@ async def browser_initialize():
         await browser_manager.initialize()
         browser_info = await browser_manager.get_browser_info()
         
-        return ServiceStatusResponse(
-            success=True,
-            message="浏览器服务初始化成功",
-            data={
+        return {
+            "success": True,
+            "message": "浏览器服务初始化成功",
+            "data": {
                 "action": "initialize",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _request_ts(),
                 "browser_status": browser_info
             }
-        )
+        }
         
     except Exception as e:
-        LOGGER.error(f"初始化浏览器失败: {e}")
+        LOGGER.error("初始化浏览器失败: {}", e)
         raise HTTPException(status_code=500, detail=f"初始化浏览器失败: {str(e)}")
 
-@router.post("/browser/action")
-async def browser_action(request: ServiceActionRequest):
+# 正在执行的过期上下文清理任务，并发的清理请求共用同一次清理
+_cleanup_inflight: Optional[asyncio.Task] = None
+
+async def _dedup_cleanup():
+    """清理过期上下文，已有清理在执行时直接等待其完成，不重复遍历所有上下文"""
+    global _cleanup_inflight
+    if _cleanup_inflight is None or _cleanup_inflight.done():
+        _cleanup_inflight = asyncio.create_task(context_manager._cleanup_expired_contexts())
+    # shield保证某个请求被取消时不会连带取消其他请求正在等待的清理
+    await asyncio.shield(_cleanup_inflight)
+
+# 浏览器服务操作表：操作名 -> (执行操作的协程函数, 成功提示)
+_BROWSER_ACTIONS = {
+    "restart": (browser_manager.force_restart, "浏览器服务重启成功"),
+    "initialize": (browser_manager.initialize, "浏览器服务初始化成功"),
+    "close": (browser_manager.close, "浏览器服务关闭成功"),
+}
+
+# 上下文管理器操作表：操作名 -> (以target为参数执行操作的协程函数, 成功提示模板, 是否需要target)
+_CONTEXT_ACTIONS = {
+    "refresh": (context_manager.refresh_context, "上下文 {target} 刷新成功", True),
+    "close": (context_manager.close_site_context, "上下文 {target} 关闭成功", True),
+    "close_all": (lambda target: context_manager.close_all(), "所有上下文关闭成功", False),
+    "cleanup": (lambda target: _dedup_cleanup(), "过期上下文清理成功", False),
+}
+
+@router.post("/browser/action", openapi_extra=_ACTION_REQUEST_OPENAPI)
+async def browser_action(request: ActionRequest):
     """执行浏览器服务操作"""
     try:
         action = request.action.lower()
         
-        if action == "restart":
-            await browser_manager.force_restart()
-            message = "浏览器服务重启成功"
-        elif action == "initialize":
-            await browser_manager.initialize()
-            message = "浏览器服务初始化成功"
-        elif action == "close":
-            await browser_manager.close()
-            message = "浏览器服务关闭成功"
-        else:
+        entry = _BROWSER_ACTIONS.get(action)
+        if entry is None:
             raise HTTPException(status_code=400, detail=f"不支持的操作: {action}")
+        action_func, message = entry
+        await action_func()
         
         # 获取操作后的状态
         browser_info = await browser_manager.get_browser_info()
         
-        return ServiceStatusResponse(
-            success=True,
-            message=message,
-            data={
+        return {
+            "success": True,
+            "message": message,
+            "data": {
                 "action": action,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _request_ts(),
                 "browser_status": browser_info
             }
-        )
+        }
         
     except HTTPException:
         raise
     except Exception as e:
-        LOGGER.error(f"执行浏览器操作失败: {e}")
+        LOGGER.error("执行浏览器操作失败: {}", e)
         raise HTTPException(status_code=500, detail=f"执行浏览器操作失败: {str(e)}")
 
 @router.get("/context/stats")
 async def get_context_stats():
     """获取上下文统计信息"""
-    try:
-        context_stats = await context_manager.get_context_stats()
-        
-        return ServiceStatusResponse(
-            success=True,
-            message="获取上下文统计成功",
-            data={
-                "service": "context",
-                "timestamp": datetime.now().isoformat(),
-                **context_stats
-            }
-        )
-        
-    except Exception as e:
-        LOGGER.error(f"获取上下文统计失败: {e}")
-        return ServiceStatusResponse(
-            success=False,
-            message=f"获取上下文统计失败: {str(e)}",
-            data={
-                "service": "context",
-                "status": "error",
-                "timestamp": datetime.now().isoformat()
-            }
-        )
+    return await _wrap_service("context", "获取上下文统计", context_manager.get_context_stats)
 
 @router.post("/context/cleanup")
 async def context_cleanup():
     """清理过期上下文"""
     try:
-        await context_manager._cleanup_expired_contexts()
+        await _dedup_cleanup()
         context_stats = await context_manager.get_context_stats()
         
-        return ServiceStatusResponse(
-            success=True,
-            message="过期上下文清理成功",
-            data={
+        return {
+            "success": True,
+            "message": "过期上下文清理成功",
+            "data": {
                 "action": "cleanup",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _request_ts(),
                 "context_status": context_stats
             }
-        )
+        }
         
     except Exception as e:
-        LOGGER.error(f"清理上下文失败: {e}")
+        LOGGER.error("清理上下文失败: {}", e)
         raise HTTPException(status_code=500, detail=f"清理上下文失败: {str(e)}")
 
-@router.post("/context/action")
-async def context_action(request: ServiceActionRequest):
+@router.post("/context/action", openapi_extra=_ACTION_REQUEST_OPENAPI)
+async def context_action(request: ActionRequest):
     """执行上下文管理器操作"""
     try:
         action = request.action.lower()
         target = request.target
         
-        if action == "refresh" and target:
-            await context_manager.refresh_context(target)
-            message = f"上下文 {target} 刷新成功"
-        elif action == "close" and target:
-            await context_manager.close_site_context(target)
-            message = f"上下文 {target} 关闭成功"
-        elif action == "close_all":
-            await context_manager.close_all()
-            message = "所有上下文关闭成功"
-        elif action == "cleanup":
-            await context_manager._cleanup_expired_contexts()
-            message = "过期上下文清理成功"
-        else:
+        entry = _CONTEXT_ACTIONS.get(action)
+        # 需要目标上下文的操作未传target时同样视为不支持
+        if entry is None or (entry[2] and not target):
             raise HTTPException(status_code=400, detail=f"不支持的操作: {action} (target: {target})")
+        action_func, message_template, _ = entry
+        await action_func(target)
+        message = message_template.format(target=target)
         
         # 获取操作后的状态
         context_stats = await context_manager.get_context_stats()
         
-        return ServiceStatusResponse(
-            success=True,
-            message=message,
-            data={
+        return {
+            "success": True,
+            "message": message,
+            "data": {
                 "action": action,
                 "target": target,
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _request_ts(),
                 "context_status": context_stats
             }
-        )
+        }
         
     except HTTPException:
         raise
     except Exception as e:
-        LOGGER.error(f"执行上下文操作失败: {e}")
+        LOGGER.error("执行上下文操作失败: {}", e)
         raise HTTPException(status_code=500, detail=f"执行上下文操作失败: {str(e)}")
 
 @router.get("/context/{site_name}/status")
 async def get_site_context_status(site_name: str):
     """获取指定站点的上下文状态"""
     try:
-        context_stats = await context_manager.get_context_stats()
+        site_info = await context_manager.get_site_context_info(site_name)
         
-        if site_name not in context_stats.get("contexts", {}):
-            return ServiceStatusResponse(
-                success=False,
-                message=f"站点 {site_name} 的上下文不存在",
-                data={
+        if site_info is None:
+            return _error_response(
+                f"站点 {site_name} 的上下文不存在",
+                {
                     "site_name": site_name,
                     "exists": False,
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _request_ts()
                 }
             )
         
-        site_info = context_stats["contexts"][site_name]
-        
-        return ServiceStatusResponse(
-            success=True,
-            message=f"获取站点 {site_name} 状态成功",
-            data={
-                "site_name": site_name,
-                "exists": True,
-                "timestamp": datetime.now().isoformat(),
-                **site_info
-            }
-        )
+        data = {"site_name": site_name, "exists": True, "timestamp": _request_ts()}
+        data.update(site_info)
+        return {
+            "success": True,
+            "message": f"获取站点 {site_name} 状态成功",
+            "data": data
+        }
         
     except Exception as e:
-        LOGGER.error(f"获取站点 {site_name} 状态失败: {e}")
-        return ServiceStatusResponse(
-            success=False,
-            message=f"获取站点状态失败: {str(e)}",
-            data={
+        LOGGER.error("获取站点 {} 状态失败: {}", site_name, e)
+        return _error_response(
+            f"获取站点状态失败: {str(e)}",
+            {
                 "site_name": site_name,
                 "status": "error",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _request_ts()
             }
         )
 
 @router.get("/health")
 async def health_check():
-    """健康检查接口"""
+    """存活检查接口，只说明进程能正常响应，不探测浏览器和上下文服务，适合高频轮询"""
+    return {
+        "status": "healthy",
+        "timestamp": _request_ts(),
+        "pid": os.getpid()
+    }
+
+@router.get("/health/deep")
+async def deep_health_check():
+    """深度健康检查接口，探测浏览器和上下文服务的状态"""
     try:
-        # 快速健康检查
-        browser_healthy = True
-        context_healthy = True
-        
-        try:
-            browser_info = await browser_manager.get_browser_info()
-            browser_healthy = browser_info.get("status") in ["healthy", "not_initialized"]
-        except Exception:
-            browser_healthy = False
-        
-        try:
-            context_stats = await context_manager.get_context_stats()
-            context_healthy = isinstance(context_stats.get("total_contexts"), int)
-        except Exception:
-            context_healthy = False
+        # 快速健康检查，两个服务并发探测
+        browser_info, context_stats = await _probe_services()
+        browser_healthy = (
+            not isinstance(browser_info, BaseException) and
+            browser_info.get("status") in ["healthy", "not_initialized"]
+        )
+        context_healthy = (
+            not isinstance(context_stats, BaseException) and
+            isinstance(context_stats.get("total_contexts"), int)
+        )
         
         overall_healthy = browser_healthy and context_healthy
         
         return {
             "status": "healthy" if overall_healthy else "unhealthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _request_ts(),
             "services": {
                 "browser": "healthy" if browser_healthy else "unhealthy",
                 "context": "healthy" if context_healthy else "unhealthy"
@@ -374,10 +482,10 @@ async def health_check():
         }
         
     except Exception as e:
-        LOGGER.error(f"健康检查失败: {e}")
+        LOGGER.error("健康检查失败: {}", e)
         return {
             "status": "unhealthy",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _request_ts(),
             "error": str(e)
         }
 
@@ -389,48 +497,17 @@ async def get_system_logs(lines: int = 100, days: Optional[int] = None, level: O
         log_path = os.environ.get("LOG_FILE_PATH", os.path.expanduser("~/FNewsCrawler.log"))
         
         if not os.path.exists(log_path):
-            return ServiceStatusResponse(
-                success=False,
-                message="日志文件不存在",
-                data={
+            return _error_response(
+                "日志文件不存在",
+                {
                     "log_path": log_path,
                     "logs": [],
-                    "timestamp": datetime.now().isoformat()
+                    "timestamp": _request_ts()
                 }
             )
         
-        # 读取日志文件
-        with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
-            all_lines = f.readlines()
-        
-        # 处理日志行，移除换行符
-        log_entries = [line.strip() for line in all_lines if line.strip()]
-        
-        # 按日志级别筛选
-        if level and level.upper() != "ALL":
-            level_filtered_logs = []
-            for log_line in log_entries:
-                log_level = extract_log_level(log_line)
-                if log_level and log_level.upper() == level.upper():
-                    level_filtered_logs.append(log_line)
-            log_entries = level_filtered_logs
-        
-        # 如果指定了天数，按日期筛选
-        if days is not None and days > 0:
-            cutoff_date = datetime.now() - timedelta(days=days)
-            filtered_logs = []
-            
-            for log_line in log_entries:
-                # 尝试从日志行中提取日期时间
-                log_datetime = extract_log_datetime(log_line)
-                if log_datetime and log_datetime >= cutoff_date:
-                    filtered_logs.append(log_line)
-            
-            log_entries = filtered_logs
-        
-        # 如果没有按日期筛选，则按行数限制
-        elif lines > 0:
-            log_entries = log_entries[-lines:] if len(log_entries) > lines else log_entries
+        # 日志文件读取和正则筛选都是阻塞/CPU操作，放到线程中执行，避免阻塞事件循环
+        log_entries = await asyncio.to_thread(_read_system_logs, log_path, lines, days, level)
         
         filter_info = ""
         filter_parts = []
@@ -445,60 +522,70 @@ async def get_system_logs(lines: int = 100, days: Optional[int] = None, level: O
         
         filter_info = f"（{' + '.join(filter_parts)}）" if filter_parts else ""
         
-        return ServiceStatusResponse(
-            success=True,
-            message=f"获取系统日志成功{filter_info}，共 {len(log_entries)} 条记录",
-            data={
+        return {
+            "success": True,
+            "message": f"获取系统日志成功{filter_info}，共 {len(log_entries)} 条记录",
+            "data": {
                 "log_path": log_path,
                 "logs": log_entries,
                 "total_lines": len(log_entries),
                 "filter_type": "days" if days is not None else "lines",
                 "filter_value": days if days is not None else lines,
                 "filter_level": level if level else "ALL",
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _request_ts()
             }
-        )
+        }
         
     except Exception as e:
-        LOGGER.error(f"获取系统日志失败: {e}")
-        return ServiceStatusResponse(
-            success=False,
-            message=f"获取系统日志失败: {str(e)}",
-            data={
+        LOGGER.error("获取系统日志失败: {}", e)
+        return _error_response(
+            f"获取系统日志失败: {str(e)}",
+            {
                 "logs": [],
-                "timestamp": datetime.now().isoformat()
+                "timestamp": _request_ts()
             }
         )
 
-def extract_log_datetime(log_line: str) -> Optional[datetime]:
-    """从日志行中提取日期时间"""
-    try:
-        # 匹配常见的日志时间格式：2025-07-27 11:57:57.875
-        pattern = r'(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})(?:\.\d+)?'
-        match = re.search(pattern, log_line)
-        
-        if match:
-            datetime_str = match.group(1)
-            return datetime.strptime(datetime_str, '%Y-%m-%d %H:%M:%S')
-        
-        return None
-        
-    except Exception:
-        return None
+def _read_system_logs(log_path: str, lines: int, days: Optional[int], level: Optional[str]) -> List[str]:
+    """读取日志文件并按级别、日期或行数筛选（同步执行，供线程池调用）"""
+    # 读取日志文件，逐行处理并移除首尾空白，每行只strip一次且不保留readlines的中间列表
+    with open(log_path, 'r', encoding='utf-8', errors='ignore') as f:
+        log_entries = [entry for entry in map(str.strip, f) if entry]
+
+    # 级别和日期筛选条件合并为一次遍历
+    level_filter = level.upper() if level and level.upper() != "ALL" else None
+    cutoff_str = None
+    if days is not None and days > 0:
+        # 日志时间格式固定为 YYYY-MM-DD HH:MM:SS，可直接按字符串比较，省去逐行strptime
+        cutoff_str = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d %H:%M:%S')
+
+    if level_filter or cutoff_str:
+        filtered_logs = []
+        for log_line in log_entries:
+            if level_filter and extract_log_level(log_line) != level_filter:
+                continue
+            if cutoff_str:
+                match = _LOG_DATETIME_RE.search(log_line)
+                if not match or match.group(1) < cutoff_str:
+                    continue
+            filtered_logs.append(log_line)
+        log_entries = filtered_logs
+
+    # 如果没有按日期筛选，则按行数限制
+    if cutoff_str is None and lines > 0:
+        log_entries = log_entries[-lines:] if len(log_entries) > lines else log_entries
+
+    return log_entries
 
 def extract_log_level(log_line: str) -> Optional[str]:
     """从日志行中提取日志级别"""
     try:
-        # 匹配常见的日志级别格式：| INFO |, | ERROR |, | WARNING |, | DEBUG |
-        pattern = r'\|\s*(DEBUG|INFO|WARNING|ERROR|CRITICAL)\s*\|'
-        match = re.search(pattern, log_line, re.IGNORECASE)
+        match = _LOG_LEVEL_RE.search(log_line)
         
         if match:
             return match.group(1).upper()
         
-        # 备用匹配：直接匹配级别关键词
-        level_pattern = r'\b(DEBUG|INFO|WARNING|ERROR|CRITICAL)\b'
-        level_match = re.search(level_pattern, log_line, re.IGNORECASE)
+        level_match = _LOG_LEVEL_FALLBACK_RE.search(log_line)
         
         if level_match:
             return level_match.group(1).upper()
@@ -5,20 +5,22 @@ FastAPI Web应用主文件
 
 提供财经新闻登录管理的Web API接口
 """
+import asyncio
 import os
 from contextlib import asynccontextmanager
+from email.utils import formatdate
 from pathlib import Path
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from fnewscrawler.utils.logger import LOGGER
 from .api import login_router, monitor_router, mcp_router, tools_router
 from fnewscrawler.mcp import mcp_server
-from fnewscrawler.mcp.mcp_manager import MCPManager
+from fnewscrawler.mcp.mcp_manager import mcp_manager
 
 
 @asynccontextmanager
@@ -28,12 +30,14 @@ async def lifespan(app: FastAPI):
     try:
         LOGGER.info("FNewsCrawler Web应用正在启动")
         # 初始化MCP工具状态
-        mcp_manager = MCPManager()
         await mcp_manager.init_tools_status()
         LOGGER.info("MCP工具状态初始化完成")
+        # 预加载新闻去重模型，模型加载是阻塞操作，放到线程中执行
+        from fnewscrawler.utils.text_duplicate import warmup_model
+        await asyncio.to_thread(warmup_model)
         
     except Exception as e:
-        LOGGER.error(f"应用启动时发生错误: {e}")
+        LOGGER.error("应用启动时发生错误: {}", e)
     
     yield
 
@@ -41,23 +45,31 @@ async def lifespan(app: FastAPI):
     try:
         LOGGER.info("FNewsCrawler Web应用正在关闭")
 
-        # 清理浏览器资源
+        # 并发关闭所有登录实例（只关闭各自的页面），总耗时取决于最慢的一个
+        from web.api.login import login_instances
+        platforms = list(login_instances.keys())
+        results = await asyncio.gather(
+            *(login_instances[platform].close() for platform in platforms),
+            return_exceptions=True
+        )
+        for platform, result in zip(platforms, results):
+            if isinstance(result, BaseException):
+                LOGGER.warning("关闭 {} 登录实例时发生错误: {}", platform, result)
+            else:
+                LOGGER.info("已关闭 {} 登录实例", platform)
+        login_instances.clear()
+
+        # 登录页面关闭后再清理浏览器资源，避免关闭页面时浏览器已经断开
         from fnewscrawler.core.browser import browser_manager
         await browser_manager.close()
 
-        # 清理登录实例
-        from web.api.login import login_instances
-        for platform, instance in login_instances.items():
-            try:
-                await instance.close()
-                LOGGER.info(f"已关闭 {platform} 登录实例")
-            except Exception as e:
-                LOGGER.warning(f"关闭 {platform} 登录实例时发生错误: {e}")
+        # 关闭异步Redis连接池
+        from fnewscrawler.core.redis_manager import get_async_redis
+        await get_async_redis().close()
 
-        login_instances.clear()
         LOGGER.info("FNewsCrawler Web应用关闭完成")
     except Exception as e:
-        LOGGER.error(f"应用关闭时发生错误: {e}")
+        LOGGER.error("应用关闭时发生错误: {}", e)
 
 mcp_app = None
 
@@ -83,14 +95,18 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    # JSON接口默认使用orjson序列化，比标准库json快
+    default_response_class=ORJSONResponse,
     lifespan=combined_lifespan
 )
 
-# 添加CORS中间件
+# 添加CORS中间件，允许的来源从环境变量读取，多个来源用逗号分隔
+# 按规范通配来源"*"不能与携带凭证同时使用，只有配置了具体来源时才允许携带凭证
+cors_origins = [origin.strip() for origin in os.getenv("CORS_ALLOW_ORIGINS", "*").split(",") if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # 在生产环境中应该限制具体域名
-    allow_credentials=True,
+    allow_origins=cors_origins,
+    allow_credentials="*" not in cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -103,7 +119,29 @@ static_dir = current_dir / "static"
 if not static_dir.exists():
     static_dir.mkdir(parents=True, exist_ok=True)
 
-app.mount("/static", StaticFiles(directory=str(static_dir)), name="static")
+class CachedStaticFiles(StaticFiles):
+    """
+    带浏览器缓存头的静态文件服务
+    StaticFiles本身已返回ETag/Last-Modified并处理304，这里补充Cache-Control，
+    缓存期内浏览器不再发请求，过期后通过ETag协商缓存。静态文件名不带内容哈希，不能设置为immutable
+    """
+
+    def __init__(self, *args, max_age: int = 3600, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.cache_control = f"public, max-age={max_age}"
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = self.cache_control
+        return response
+
+
+app.mount(
+    "/static",
+    CachedStaticFiles(directory=str(static_dir), max_age=int(os.getenv("STATIC_CACHE_MAX_AGE", 3600))),
+    name="static"
+)
 
 # 配置模板引擎
 templates_dir = current_dir / "templates"
@@ -111,6 +149,28 @@ if not templates_dir.exists():
     templates_dir.mkdir(parents=True, exist_ok=True)
 
 templates = Jinja2Templates(directory=str(templates_dir))
+# 模板随程序发布，运行期间不会修改：关闭每次渲染前的文件修改检查，并在启动时预先编译全部模板
+templates.env.auto_reload = False
+for template_name in templates.env.list_templates(extensions=["html"]):
+    templates.env.get_template(template_name)
+
+# 页面都继承自base.html，取全部模板中最新的修改时间作为页面的Last-Modified
+_PAGE_LAST_MODIFIED = formatdate(
+    max((p.stat().st_mtime for p in templates_dir.glob("*.html")), default=0),
+    usegmt=True
+)
+
+
+def _render_page(request: Request, name: str, context: dict) -> Response:
+    """
+    渲染页面模板，浏览器携带的If-Modified-Since与模板修改时间一致时直接返回304，跳过模板渲染
+    """
+    if request.headers.get("if-modified-since") == _PAGE_LAST_MODIFIED:
+        return Response(status_code=304)
+    response = templates.TemplateResponse(request, name, context)
+    response.headers["Last-Modified"] = _PAGE_LAST_MODIFIED
+    response.headers["Cache-Control"] = "no-cache, must-revalidate"
+    return response
 
 # 挂载MCP服务器
 app.mount("/mcp", mcp_app)
@@ -125,7 +185,7 @@ app.include_router(tools_router, prefix="/api/call_tools", tags=["get方法调
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """主页"""
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "index.html", 
         {"title": "FNewsCrawler - 财经新闻爬虫管理平台"}
@@ -135,7 +195,7 @@ async def home(request: Request):
 @app.get("/login", response_class=HTMLResponse)
 async def login_page(request: Request):
     """登录管理页面"""
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "login.html", 
         {"title": "登录管理"}
@@ -147,7 +207,7 @@ async def login_page(request: Request):
 @app.get("/monitor", response_class=HTMLResponse)
 async def monitor_page(request: Request):
     """系统监控页面"""
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "monitor.html", 
         {"title": "系统监控"}
@@ -157,7 +217,7 @@ async def monitor_page(request: Request):
 @app.get("/mcp", response_class=HTMLResponse)
 async def mcp_page(request: Request):
     """MCP管理页面"""
-    return templates.TemplateResponse(
+    return _render_page(
         request,
         "mcp.html", 
         {"title": "MCP管理"}